@@ -0,0 +1,95 @@
+"""Compares the compiled blacklist engine with the original keyword-by-keyword / regex-by-regex check.
+
+Usage: python benchmarks/bench_blacklist.py [--names 200000] [--extra-keywords 2000] [--processes 4] [--repeat 3]
+Exits with status 1 if any name gets a different verdict from the reference implementation.
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fbscraper.blacklist import BlacklistFilter, ahocorasick  # noqa: E402
+from fbscraper.processing import blacklist_keywords, blacklist_patterns  # noqa: E402
+
+
+def reference_contains_blacklist(text, keywords, compiled_patterns):
+    # Salinan fungsi contains_blacklist sebelum engine terkompilasi; jangan dioptimasi
+    lower_text = text.lower()
+    if any(kw in lower_text for kw in keywords): return True
+    for pattern in compiled_patterns:
+        if pattern.search(lower_text): return True
+    return False
+
+
+def build_names(count, keywords, seed=1):
+    rng = random.Random(seed)
+    words = ["Komunitas", "Jual Beli", "Info", "Loker", "Belajar", "Python", "Otomasi", "Kuliner", "Warga", "Alumni",
+             "Group", "Indonesia", "Jakarta", "Surabaya", "Gamers", "Fotografi", "UMKM", "Sepeda", "Pecinta", "Kucing"]
+    noise = ["Last active 5 minutes ago", "Terakhir aktif 3 jam yang lalu", "Active about an hour ago",
+             "BERITA JAKARTA 2024", "Terakhir aktif sejam lalu", "last active a few seconds ago",
+             "Laſt active 2 days ago", "Café Déjà Vu Terakhir aktif 4 hari yang lalu"]
+    names = []
+    for i in range(count):
+        name = " ".join(rng.choice(words) for _ in range(rng.randint(2, 5)))
+        roll = rng.random()
+        if roll < 0.05: name = f"{name} {rng.choice(noise)}"
+        elif roll < 0.10: name = f"{name} {rng.choice(keywords).title()}"
+        names.append(f"{name} {i}")
+    return names
+
+
+def best_of(repeat, func):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter(); result = func(); elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_case(label, names, keywords, patterns, processes, repeat):
+    compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
+    engine = BlacklistFilter(keywords, patterns)
+    ref_time, expected = best_of(repeat, lambda: [reference_contains_blacklist(n, keywords, compiled) for n in names])
+    eng_time, actual = best_of(repeat, lambda: engine.mask(names))
+    mismatches = [n for n, a, b in zip(names, expected, actual) if a != b]
+    kept = [n for n, blocked in zip(names, expected) if not blocked]
+    batch_time, batch_kept = best_of(repeat, lambda: list(engine.filter(names, processes=processes)))
+    if batch_kept != kept: mismatches.append("<filter() output differs from reference>")
+
+    print(f"--- {label}: {len(names)} names, {len(keywords)} keywords, {len(patterns)} patterns ---")
+    print(f"Blacklisted          : {len(names) - len(kept)}")
+    print(f"Reference (best)     : {ref_time:.3f}s")
+    print(f"Engine mask (best)   : {eng_time:.3f}s  ({ref_time / eng_time:.1f}x)")
+    print(f"Engine filter (best) : {batch_time:.3f}s  (processes={processes or 1})")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--names", type=int, default=200_000)
+    parser.add_argument("--extra-keywords", type=int, default=2000, help="Size of the synthetic large keyword list.")
+    parser.add_argument("--processes", type=int, default=0, help="Process pool size for filter() (0 = in-process).")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Keyword matcher: {'pyahocorasick' if ahocorasick is not None else 'trie regex (pyahocorasick not installed)'}")
+    names = build_names(args.names, blacklist_keywords)
+    mismatches = run_case("built-in lists", names, blacklist_keywords, blacklist_patterns, args.processes, args.repeat)
+    rng = random.Random(2)
+    extra = [f"spam{rng.randint(0, 10**9)} promo" for _ in range(args.extra_keywords)]
+    big_keywords = blacklist_keywords + extra
+    names = build_names(args.names, big_keywords, seed=3)
+    mismatches += run_case("large keyword list", names, big_keywords, blacklist_patterns + [r"(\w)\1{4,}"], args.processes, args.repeat)
+
+    if mismatches:
+        print(f"[ERROR] {len(mismatches)} verdicts differ from the reference, e.g. {mismatches[:5]}")
+        sys.exit(1)
+    print("Parity OK: engine verdicts match the reference implementation.")
+
+
+if __name__ == "__main__":
+    main()
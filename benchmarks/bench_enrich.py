@@ -0,0 +1,85 @@
+"""Enrichment benchmark against the local fixture: cold cache vs warm cache, checked against the fixture's metadata.
+
+Runs the same job path as the CLI/GUI (fbscraper.jobs.run_scraping_jobs) with enrichment enabled, twice with the
+same temporary metadata cache. The first run fetches every group's About page; the second must be served from cache.
+
+Usage: python benchmarks/bench_enrich.py [--groups 200] [--workers 1 2 4] [--rps 20] [--about-latency 0.2]
+Exits with status 1 if any enriched row differs from the fixture or the warm run fetches pages again.
+"""
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fbscraper.jobs import run_scraping_jobs  # noqa: E402
+from fbscraper.processing import canonical_group_id  # noqa: E402
+from fbscraper.reporting import ConsoleReporter  # noqa: E402
+from fixture_server import expected_metadata, fixture_job_args, group_id, start_fixture_server  # noqa: E402
+
+
+def check_csv(path, groups):
+    """Number of CSV rows whose Members/Privacy/Activity differ from the fixture (missing rows count too)."""
+    rows = {}
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f): rows[canonical_group_id(row["GroupURL"])] = row
+    mismatches = 0
+    for i in range(groups):
+        row, expected = rows.get(str(group_id(i))), expected_metadata(i)
+        if not row or (row["Members"], row["Privacy"], row["Activity"]) != (str(expected["members"]), expected["privacy"], expected["activity"]):
+            mismatches += 1
+    return mismatches
+
+
+def run_once(base_url, tmp, workers, args, cache_path):
+    with fixture_job_args(tmp, base_url, headless=not args.no_headless, verbose=args.verbose, lean=True, scroll_delay=0.5, max_scroll=5,
+                          wait_timeout=2.0, end_checks=2, enrich=True, enrich_workers=workers, enrich_rps=args.rps, enrich_ttl=1,
+                          enrich_cache=str(cache_path)) as job_args:
+        output = Path(job_args.output)
+        job = run_scraping_jobs(job_args, ConsoleReporter(args.verbose))[0]
+    counters = job.metrics.snapshot()["counters"]
+    return {
+        "status": job.status,
+        "enrich_seconds": round(job.timings.get("enrich", 0.0), 3),
+        "fetched": counters.get("enrich_fetched", 0),
+        "cache_hits": counters.get("enrich_cache_hits", 0),
+        "errors": counters.get("enrich_errors", 0),
+        "mismatches": check_csv(output, args.groups),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Enrichment browsers to compare.")
+    parser.add_argument("--rps", type=float, default=20.0, help="Request limit per account.")
+    parser.add_argument("--about-latency", type=float, default=0.2, help="Seconds before each About page is served.")
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--no-headless", action="store_true")
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(args.groups, about_latency=args.about_latency)
+    ok = True
+    try:
+        for workers in args.workers:
+            with tempfile.TemporaryDirectory() as tmp:
+                cache_path = Path(tmp) / "group_meta.sqlite"
+                start = time.perf_counter()
+                cold = run_once(base_url, tmp, workers, args, cache_path)
+                cold_wall = time.perf_counter() - start
+                warm = run_once(base_url, tmp, workers, args, cache_path)
+            rate = cold["fetched"] / cold["enrich_seconds"] if cold["enrich_seconds"] else 0.0
+            print(f"{workers} browser(s): cold {cold['fetched']} pages in {cold['enrich_seconds']:.1f}s ({rate:.1f} pages/s, "
+                  f"{cold_wall:.1f}s wall), warm {warm['fetched']} fetched / {warm['cache_hits']} cached in {warm['enrich_seconds']:.2f}s, "
+                  f"mismatches {cold['mismatches']}/{warm['mismatches']}, errors {cold['errors']}")
+            ok = ok and cold["status"] == warm["status"] == "Completed" and not cold["mismatches"] and not warm["mismatches"] and not warm["fetched"]
+    finally:
+        server.shutdown()
+    if not ok: sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compares the legacy per-element extraction with the batched single-script extraction.
+
+Usage: python benchmarks/bench_extraction.py [--links 5000] [--repeat 3] [--no-headless]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fbscraper.browser import create_driver, fetch_group_links_batched, fetch_group_links_per_element  # noqa: E402
+from fbscraper.processing import normalize_group_links  # noqa: E402
+
+
+def build_fixture(path, links):
+    rows = []
+    for i in range(links):
+        rows.append(f'<div role="listitem"><a role="link" href="https://www.facebook.com/groups/{100000 + i}/">Group Fixture {i}</a></div>')
+        # Noise yang harus diabaikan oleh XPath: tanpa role, teks kosong, bukan /groups/
+        if i % 50 == 0:
+            rows.append(f'<a href="/groups/{100000 + i}/">no role {i}</a><a role="link" href="/groups/{i}/"> </a><a role="link" href="/pages/{i}/">Page {i}</a>')
+            # Link grup tersembunyi: element.text Selenium memberi '' sehingga jalur batch juga harus melewatinya
+            rows.append(f'<a role="link" style="display:none" href="/groups/{900000 + i}/">Hidden {i}</a>'
+                        f'<div style="visibility:hidden"><a role="link" href="/groups/{800000 + i}/">Invisible {i}</a></div>')
+    html = f"<!doctype html><html><body><div role=\"main\"><h1>Groups</h1>{''.join(rows)}</div></body></html>"
+    Path(path).write_text(html, encoding="utf-8")
+
+
+def time_path(driver, batched, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        data = {}
+        start = time.perf_counter()
+        pairs = fetch_group_links_batched(driver) if batched else fetch_group_links_per_element(driver)
+        normalize_group_links(pairs, data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        result = data
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-headless", action="store_true")
+    args = parser.parse_args()
+
+    driver = create_driver(headless=not args.no_headless)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fixture = Path(tmp) / "groups.html"
+            build_fixture(fixture, args.links)
+            driver.get(fixture.as_uri())
+            legacy_time, legacy_data = time_path(driver, batched=False, repeat=args.repeat)
+            batched_time, batched_data = time_path(driver, batched=True, repeat=args.repeat)
+    finally:
+        driver.quit()
+
+    if legacy_data != batched_data:
+        print("[ERROR] Batched extraction result differs from per-element extraction.")
+        sys.exit(1)
+    print(f"Links on page        : {args.links}")
+    print(f"Unique groups        : {len(batched_data)}")
+    print(f"Per-element (best)   : {legacy_time:.3f}s")
+    print(f"Batched (best)       : {batched_time:.3f}s")
+    print(f"Speedup              : {legacy_time / batched_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Runs several scraping jobs in parallel against the local fixture server.
+
+Usage: python benchmarks/bench_jobs.py [--jobs 4] [--workers 4] [--groups 1000]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fbscraper.jobs import run_scraping_jobs  # noqa: E402
+from fixture_server import fixture_job_args, start_fixture_server  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--groups", type=int, default=1000)
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(args.groups)
+    with tempfile.TemporaryDirectory() as tmp, fixture_job_args(tmp, base_url, accounts=args.jobs, verbose=False, scroll_delay=0.2, max_scroll=5,
+                                                                wait_timeout=2.0, end_checks=2, workers=args.workers) as job_args:
+        start = time.perf_counter()
+        jobs = run_scraping_jobs(job_args)
+        elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    print(f"Jobs / workers : {args.jobs} / {args.workers}")
+    print(f"Statuses       : {[job.status for job in jobs]}")
+    print(f"Groups per job : {[len(job.collected_group_data) for job in jobs]}")
+    print(f"Wall time      : {elapsed:.2f}s")
+    if any(len(job.collected_group_data) != args.groups for job in jobs):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
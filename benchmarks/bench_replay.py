@@ -0,0 +1,66 @@
+"""Browserless replay benchmark: re-extracts and re-filters an archive of synthetic page snapshots.
+
+Builds --days x --accounts gzip snapshots of the fixture's groups page (each with --groups groups, noise names,
+navigation and duplicate '?ref=' links), then times fbscraper.replay.replay_snapshots once per --processes value.
+
+Usage: python benchmarks/bench_replay.py [--groups 5000] [--days 30] [--accounts 2] [--processes 1 4]
+Exits with status 1 if a replay finds a different number of groups than the fixture holds.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fbscraper.reporting import ConsoleReporter  # noqa: E402
+from fbscraper.replay import available_parser, replay_snapshots, write_snapshot  # noqa: E402
+from fixture_server import NAV_LINKS, expected_groups, group_links_html, noise_indices  # noqa: E402
+
+
+def build_archive(directory, args):
+    fixture = SimpleNamespace(noise=noise_indices(args.groups, args.noise_ratio), batch_size=50)
+    nav = "".join(f'<a role="link" href="{href}">{text}</a>' for href, text in NAV_LINKS)
+    body = f"<html><body><div role='navigation'>{nav}</div><div role='main'><h1>Groups</h1>{group_links_html(0, args.groups, fixture)}</div></body></html>"
+    total = 0
+    for account in range(args.accounts):
+        for day in range(args.days):
+            meta = {'profile': f"Account{account}", 'base_url': "https://www.facebook.com", 'kind': "page", 'taken_at': 1_700_000_000 + day * 86400}
+            total += write_snapshot(Path(directory) / f"Account{account}_day{day:02d}.html.gz", body, meta)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--accounts", type=int, default=2)
+    parser.add_argument("--noise-ratio", type=float, default=0.05)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    expected_unique, expected_kept = expected_groups(args.groups, args.noise_ratio)
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "snapshots"
+        start = time.perf_counter()
+        size = build_archive(archive, args)
+        print(f"Archive: {args.days * args.accounts} snapshots, {size / 2**20:.1f} MB compressed, built in {time.perf_counter() - start:.1f}s "
+              f"(parser: {available_parser()})")
+        for processes in args.processes:
+            start = time.perf_counter()
+            summary = replay_snapshots([archive], Path(tmp) / "replay.csv", "utf-8", ConsoleReporter(args.verbose), processes=processes)
+            elapsed = time.perf_counter() - start
+            per_profile = [result for profile, result in summary.items() if profile != 'merged']
+            good = len(per_profile) == args.accounts and all(total == expected_unique and kept == expected_kept for total, kept, _ in per_profile)
+            ok = ok and good
+            print(f"{processes} process(es): {elapsed:.2f}s ({args.days * args.accounts / elapsed:.1f} snapshots/s), "
+                  f"{per_profile[0][0] if per_profile else 0} groups / {per_profile[0][1] if per_profile else 0} kept per account, {'OK' if good else 'MISMATCH'}")
+    if not ok: sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""End-to-end scrape benchmark against the local infinite-scroll fixture (no Facebook account needed).
+
+Runs the same job path as the CLI/GUI (fbscraper.jobs.run_scraping_jobs) headlessly for each --sizes value and
+writes groups/sec, scroll iterations, per-phase wall time and Chrome peak memory to a JSON file. Pass an earlier
+result file as --baseline to print the change per size.
+
+Usage: python benchmarks/bench_scrape.py [--sizes 1000 10000 50000] [--batch-size 50] [--latency 0.1] [--jitter 0.05]
+                                         [--lean] [--json bench_scrape.json] [--baseline previous.json]
+Exits with status 1 if a run misses groups or keeps a different number of groups after filtering.
+"""
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fbscraper.jobs import run_scraping_jobs  # noqa: E402
+from fbscraper.reporting import ConsoleReporter  # noqa: E402
+from fixture_server import expected_groups, fixture_job_args, start_fixture_server  # noqa: E402
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def count_lines(path):
+    try:
+        with open(path, encoding="utf-8") as f: return sum(1 for _ in f)
+    except OSError:
+        return None
+
+
+def run_size(size, args):
+    server, base_url = start_fixture_server(size, batch_size=args.batch_size, latency=args.latency, jitter=args.jitter,
+                                            noise_ratio=args.noise_ratio)
+    try:
+        with tempfile.TemporaryDirectory() as tmp, fixture_job_args(
+                tmp, base_url, headless=not args.no_headless, verbose=args.verbose, lean=args.lean, scroll_delay=args.scroll_delay,
+                max_scroll=math.ceil(size / args.batch_size) * 2 + 20, wait_timeout=args.wait_timeout, end_checks=args.end_checks) as job_args:
+            output = Path(job_args.output)
+            start = time.perf_counter()
+            job = run_scraping_jobs(job_args, ConsoleReporter(args.verbose))[0]
+            wall = time.perf_counter() - start
+            kept = count_lines(output.with_name(f"{output.stem}_names_filtered_{job.profile_name}.txt"))
+    finally:
+        server.shutdown()
+
+    expected_unique, expected_kept = expected_groups(size, args.noise_ratio)
+    groups = len(job.collected_group_data)
+    monitor = job.monitor
+    return {
+        "size": size,
+        "status": job.status,
+        "groups": groups,
+        "expected_groups": expected_unique,
+        "kept_after_filter": kept,
+        "expected_kept": expected_kept,
+        "wall_seconds": round(wall, 3),
+        "groups_per_second": round(groups / job.timings["scroll"], 1) if job.timings.get("scroll") else None,
+        "scroll_iterations": job.scroll_count,
+        "phase_seconds": {phase: round(seconds, 3) for phase, seconds in job.timings.items()},
+        "chrome_peak_rss_bytes": monitor.peak_rss or None if monitor else None,
+        "chrome_peak_js_heap_bytes": monitor.peak_js_heap or None if monitor else None,
+        "bytes_received": monitor.bytes_received if monitor else None,
+        "ok": job.status == "Completed" and groups == expected_unique and kept == expected_kept,
+    }
+
+
+def print_comparison(results, baseline_path):
+    baseline = {r["size"]: r for r in json.loads(Path(baseline_path).read_text(encoding="utf-8"))["results"]}
+    print(f"\nCompared with {baseline_path}:")
+    for result in results:
+        before = baseline.get(result["size"])
+        if not before or not before.get("groups_per_second") or not result["groups_per_second"]: continue
+        change = (result["groups_per_second"] / before["groups_per_second"] - 1) * 100
+        print(f"  {result['size']:>6} groups: {before['groups_per_second']:.1f} -> {result['groups_per_second']:.1f} groups/s ({change:+.1f}%), "
+              f"wall {before['wall_seconds']:.1f}s -> {result['wall_seconds']:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--batch-size", type=int, default=50, help="Groups per lazy-loaded batch.")
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds before each batch is served.")
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--noise-ratio", type=float, default=0.05)
+    parser.add_argument("--scroll-delay", type=float, default=0.5)
+    parser.add_argument("--wait-timeout", type=float, default=5.0)
+    parser.add_argument("--end-checks", type=int, default=3)
+    parser.add_argument("--lean", action="store_true")
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--no-headless", action="store_true")
+    parser.add_argument("--json", default="bench_scrape.json", help="Result file (default: %(default)s).")
+    parser.add_argument("--baseline", help="Earlier result file to compare against.")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        result = run_size(size, args)
+        results.append(result)
+        print(f"{size:>6} groups: {result['status']}, {result['groups']}/{result['expected_groups']} found, "
+              f"{result['groups_per_second']} groups/s, {result['scroll_iterations']} scrolls, {result['wall_seconds']:.1f}s wall")
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("json", "baseline")},
+        "results": results,
+    }
+    Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Results written to {args.json}")
+    if args.baseline: print_comparison(results, args.baseline)
+    if not all(r["ok"] for r in results): sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
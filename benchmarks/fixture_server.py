@@ -0,0 +1,234 @@
+"""Local HTTP stand-in for the Facebook pages the scraper visits (/, /me/, /groups/joins/).
+
+/groups/<id>/about/ serves each group's member count, privacy and activity (see group_meta) for enrichment.
+With --batch-size the groups page behaves like an infinite scroll: only the first batch is rendered and each
+scroll near the bottom fetches the next one from /fixture/groups after --latency (+/- --jitter) seconds.
+--noise-ratio mixes in groups whose names the blacklist must drop; navigation links and duplicate '?ref='
+links are always present on the lazy page. A duplicate comes before its group's own link and reads like the
+sidebar ('<name> / Last active 5 minutes ago'), so the group must keep its clean name.
+
+Usage: python benchmarks/fixture_server.py [--groups 1000] [--port 8765] [--batch-size 20] [--latency 0.2] [--jitter 0.1]
+"""
+import argparse
+import html
+import json
+import os
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+NOISE_NAMES = ["Berita Jakarta 2024", "Last active 5 minutes ago", "Terakhir aktif 3 jam yang lalu",
+               "Discover", "See all", "Lihat grup"]
+DUPLICATE_NOISE = "Last active 5 minutes ago"
+NAV_LINKS = [("/groups/feed/", "Your feed"), ("/groups/discover/", "Discover"), ("/groups/create/", "Create new group")]
+
+
+def _png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+# PNG 1x1 transparan: cukup untuk menguji pemblokiran gambar di Lean Mode
+PIXEL_PNG = (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 6, 0, 0, 0))
+             + _png_chunk(b"IDAT", zlib.compress(b"\x00\x00\x00\x00\x00")) + _png_chunk(b"IEND", b""))
+
+LAZY_SCROLL_JS = """
+let offset = %(initial)d, loading = false, done = %(done)s;
+const nearBottom = () => window.innerHeight + window.scrollY >= document.body.scrollHeight - 800;
+async function loadMore() {
+    if (loading || done) return;
+    loading = true;
+    const response = await fetch('/fixture/groups?offset=' + offset + '&limit=%(batch)d');
+    const data = await response.json();
+    document.getElementById('feed').insertAdjacentHTML('beforeend', data.html);
+    offset += data.count; done = data.done; loading = false;
+    if (!done && nearBottom()) loadMore();
+}
+window.addEventListener('scroll', () => { if (nearBottom()) loadMore(); }, {passive: true});
+"""
+
+
+def group_id(i):
+    return 100000 + i
+
+def group_meta(i):
+    """(members, privacy, new posts today) shown on the About page of fixture group i."""
+    return 50 + (i * 37) % 20000, "Private" if i % 3 == 0 else "Public", i % 12
+
+def expected_metadata(i):
+    """The metadata fbscraper.enrich must parse from the About page of fixture group i."""
+    members, privacy, posts = group_meta(i)
+    return {"members": members, "privacy": privacy.lower(), "activity": f"{posts} new post{'' if posts == 1 else 's'} today"}
+
+def group_name(server, i):
+    return NOISE_NAMES[i % len(NOISE_NAMES)] + f" {i}" if i in server.noise else f"Fixture Group {i}"
+
+def group_links_html(start, stop, server=None):
+    cards = []
+    for i in range(start, stop):
+        name = html.escape(group_name(server, i)) if server is not None else f"Fixture Group {i}"
+        # Link duplikat ke grup yang sama (bentuk URL lain, teks noise ala sidebar) muncul lebih dulu di DOM:
+        # harus di-dedupe lewat ID grup tanpa menggantikan nama bersih dari link utamanya
+        if server is not None and server.batch_size and i % 10 == 0:
+            cards.append(f'<div class="card"><a role="link" href="/groups/{group_id(i)}/?ref=bookmarks">{name}<br>{DUPLICATE_NOISE}</a></div>')
+        cards.append(f'<div role="listitem" class="card"><img src="/img/{group_id(i)}.png" width="40" height="40">'
+                     f'<a role="link" href="/groups/{group_id(i)}/">{name}</a></div>')
+    return "".join(cards)
+
+def noise_indices(groups, noise_ratio, seed=1):
+    rng = random.Random(seed)
+    return set(rng.sample(range(groups), int(groups * noise_ratio))) if noise_ratio > 0 else set()
+
+def expected_groups(groups, noise_ratio=0.0, seed=1):
+    """(unique_groups, groups_kept_after_blacklist) that a complete scrape of the fixture must produce."""
+    return groups, groups - len(noise_indices(groups, noise_ratio, seed))
+
+
+ABOUT_PATH_RE = re.compile(r"^/groups/(\d+)/about/?$")
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    server_version = "FixtureFacebook/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, data, content_type, status=200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_html(self, body, status=200, script=""):
+        head = "<meta charset='utf-8'><style>.card{height:64px;display:flex;align-items:center;gap:8px}</style>"
+        script = f"<script>{script}</script>" if script else ""
+        self.send_body(f"<!doctype html><html><head>{head}</head><body>{body}{script}</body></html>".encode("utf-8"),
+                       "text/html; charset=utf-8", status)
+
+    def groups_page(self):
+        server = self.server
+        if not server.batch_size:
+            self.send_html(f"<div role='main'><h1>Groups</h1>{group_links_html(0, server.groups, server)}</div>")
+            return
+        initial = min(server.batch_size, server.groups)
+        nav = "".join(f'<a role="link" href="{href}">{text}</a>' for href, text in NAV_LINKS)
+        body = f"<div role='navigation'>{nav}</div><div role='main'><h1>Groups</h1><div id='feed'>{group_links_html(0, initial, server)}</div></div>"
+        script = LAZY_SCROLL_JS % {"initial": initial, "batch": server.batch_size, "done": "true" if initial >= server.groups else "false"}
+        self.send_html(body, script=script)
+
+    def groups_batch(self, query):
+        server = self.server
+        offset = int(query.get("offset", ["0"])[0]); limit = int(query.get("limit", [str(server.batch_size)])[0])
+        delay = server.latency + random.uniform(-server.jitter, server.jitter)
+        if delay > 0: time.sleep(delay)
+        stop = min(offset + limit, server.groups)
+        payload = {"html": group_links_html(offset, stop, server), "count": max(0, stop - offset), "done": stop >= server.groups}
+        self.send_body(json.dumps(payload).encode("utf-8"), "application/json")
+
+    def group_about(self, i):
+        server = self.server
+        if not 0 <= i < server.groups:
+            self.send_html("<div role='main'><h1>Not Found</h1></div>", status=404); return
+        if server.about_latency > 0: time.sleep(server.about_latency)
+        members, privacy, _ = group_meta(i)
+        activity = expected_metadata(i)["activity"]
+        self.send_html(f"<div role='main'><h1>{html.escape(group_name(server, i))}</h1><div>{privacy} group · {members:,} members</div>"
+                       f"<h2>Activity</h2><div>{activity}</div><div>Created 3 years ago</div></div>")
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = parts.path
+        if path in ("/", ""):
+            self.send_html("<div role='main'><h1>Home</h1></div>")
+        elif path.rstrip("/") == "/me":
+            name = html.escape(self.server.profile_name)
+            self.send_html(f"<div role='main'><h1>{name}<span> (Fixture)</span></h1></div>")
+        elif path.rstrip("/") == "/groups/joins":
+            self.groups_page()
+        elif path == "/fixture/groups":
+            self.groups_batch(parse_qs(parts.query))
+        elif ABOUT_PATH_RE.match(path):
+            self.group_about(int(ABOUT_PATH_RE.match(path).group(1)) - group_id(0))
+        elif path.startswith("/img/"):
+            self.send_body(PIXEL_PNG, "image/png")
+        else:
+            self.send_html("<div role='main'><h1>Not Found</h1></div>", status=404)
+
+
+def start_fixture_server(groups=1000, port=0, profile_name="Fixture User", batch_size=None, latency=0.0, jitter=0.0,
+                         noise_ratio=0.0, seed=1, about_latency=0.0):
+    """Starts the fixture server on a daemon thread. Returns (server, base_url).
+
+    batch_size=None renders every group at once; otherwise the page lazy-loads batch_size groups per scroll.
+    about_latency delays every group About page, like a slow Facebook response during enrichment.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), FixtureHandler)
+    server.groups = groups
+    server.profile_name = profile_name
+    server.batch_size = batch_size
+    server.latency, server.jitter = latency, min(jitter, latency)
+    server.noise = noise_indices(groups, noise_ratio, seed)
+    server.about_latency = about_latency
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def fixture_cookies(directory, accounts=1):
+    """Writes one cookies file per fixture account (distinct c_user values) into directory. Returns their paths."""
+    paths = []
+    for i in range(accounts):
+        path = Path(directory) / f"account{i}.cookies.json"
+        path.write_text(json.dumps([{"name": "c_user", "value": str(4242 + i), "domain": "127.0.0.1", "path": "/"}]), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+@contextmanager
+def fixture_job_args(directory, base_url, accounts=1, **overrides):
+    """Complete scraping args for a run against the fixture, as the CLI builds them (fbscraper.cli.build_parser
+    defaults), with cookies for accounts fixture accounts and the output in directory, plus overrides.
+
+    FBSCRAPER_CACHE_DIR points into directory until the block exits, so chromedriver, profile and metadata caches
+    of a benchmark never touch the real ~/.cache/fbscraper.
+    """
+    from fbscraper.cli import build_parser
+    args = build_parser().parse_args([])
+    args.cookies, args.output, args.base_url = fixture_cookies(directory, accounts), str(Path(directory) / "groups_data.csv"), base_url
+    for name, value in overrides.items():
+        if not hasattr(args, name): raise TypeError(f"Unknown scraping argument: {name}")
+        setattr(args, name, value)
+    previous = os.environ.get("FBSCRAPER_CACHE_DIR")
+    os.environ["FBSCRAPER_CACHE_DIR"] = str(Path(directory) / "cache")
+    try:
+        yield args
+    finally:
+        if previous is None: os.environ.pop("FBSCRAPER_CACHE_DIR", None)
+        else: os.environ["FBSCRAPER_CACHE_DIR"] = previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=1000)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--batch-size", type=int, default=None, help="Groups per lazy-loaded batch (default: all at once).")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before each batch is served.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds added to --latency.")
+    parser.add_argument("--noise-ratio", type=float, default=0.0, help="Share of groups with blacklisted names.")
+    parser.add_argument("--about-latency", type=float, default=0.0, help="Seconds before each group About page is served.")
+    args = parser.parse_args()
+    server, base_url = start_fixture_server(args.groups, args.port, batch_size=args.batch_size, latency=args.latency,
+                                            jitter=args.jitter, noise_ratio=args.noise_ratio, about_latency=args.about_latency)
+    print(f"Fixture server running at {base_url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Facebook joined-groups scraper.
+
+The package is split so that importing it stays cheap: Selenium is only imported by
+``fbscraper.browser`` / ``fbscraper.jobs`` and Tk only by ``fbscraper.gui``.
+Run ``python -m fbscraper --help`` for the headless command line.
+"""
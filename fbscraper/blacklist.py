@@ -0,0 +1,196 @@
+import json
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+try:
+    import ahocorasick  # opsional (pip install pyahocorasick): lebih cepat untuk daftar keyword yang besar
+except ImportError:
+    ahocorasick = None
+
+try:
+    from re import _constants as _sre_constants, _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_constants as _sre_constants, sre_parse as _sre_parse
+
+from .processing import blacklist_keywords, blacklist_patterns, split_paths
+
+# Engine filter yang dikompilasi sekali: semua keyword dalam satu automaton Aho-Corasick (atau satu regex
+# regex trie), semua pola regex dalam satu pola gabungan dengan named group per aturan.
+PARALLEL_THRESHOLD = 200_000  # di bawah ini, overhead process pool lebih mahal dari filternya
+CHUNK_SIZE = 20_000
+
+BlacklistMatch = namedtuple("BlacklistMatch", "kind rule")  # kind: 'keyword' atau 'pattern'
+
+# Backreference / named group bawaan tidak bisa digabung ke satu alternasi; pola seperti itu dicek terpisah
+_UNMERGEABLE = re.compile(r"\\[1-9]|\(\?P[<=]|\\g<")
+
+
+def trie_regex(words):
+    """Regex source matching any of words, factored into a prefix trie (much faster in re than a flat alternation)."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word: node = node.setdefault(ch, {})
+        node[""] = {}
+    def build(node):
+        alternatives = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alternatives: return ""
+        body = alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+        return f"(?:{body})?" if "" in node else body
+    return build(trie)
+
+def required_literals(pattern):
+    """Lowercase ASCII strings of which any match of pattern contains at least one, or None when none can be derived.
+
+    Only mandatory top-level parts are used: literal runs and groups that are a literal or an alternation of literals.
+    """
+    try: parsed = _sre_parse.parse(pattern, re.IGNORECASE)
+    except re.error: return None
+    LITERAL, SUBPATTERN, BRANCH = _sre_constants.LITERAL, _sre_constants.SUBPATTERN, _sre_constants.BRANCH
+    def literal_text(items):
+        if not items or any(op is not LITERAL for op, _ in items): return None
+        return "".join(chr(av) for _, av in items)
+    candidates, run = [], []
+    for op, av in parsed:
+        if op is LITERAL: run.append(chr(av)); continue
+        if run: candidates.append({"".join(run)}); run = []
+        if op is SUBPATTERN:
+            items = list(av[-1])
+            if len(items) == 1 and items[0][0] is BRANCH:
+                options = [literal_text(list(branch)) for branch in items[0][1][1]]
+                if all(options): candidates.append(set(options))
+            elif literal_text(items):
+                candidates.append({literal_text(items)})
+    if run: candidates.append({"".join(run)})
+    candidates = [{text.lower() for text in c} for c in candidates if all(text.isascii() for text in c)]
+    best = max(candidates, key=lambda c: min(map(len, c)), default=None)
+    return best if best and min(map(len, best)) >= 3 else None
+
+
+class BlacklistFilter(object):
+    """Compiled equivalent of contains_blacklist(): keywords are substrings of the lowercased name, patterns are
+    searched case-insensitively. Keywords are used as given, so write them in lowercase."""
+    def __init__(self, keywords=None, patterns=None):
+        self.keywords = list(blacklist_keywords if keywords is None else keywords)
+        self.patterns = list(blacklist_patterns if patterns is None else patterns)
+        self.match_all = "" in self.keywords  # '' in text selalu True, sama seperti fungsi lama
+        self.automaton = self.keyword_regex = None
+        keywords = [kw for kw in dict.fromkeys(self.keywords) if kw]
+        if keywords and ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for kw in keywords: self.automaton.add_word(kw, kw)
+            self.automaton.make_automaton()
+        elif keywords:
+            self.keyword_regex = re.compile(trie_regex(keywords))
+        self.pattern_regex, self.group_rules, self.separate_patterns = self._compile_patterns(self.patterns)
+        # Prefilter: pola gabungan hanya dijalankan jika nama memuat salah satu literal wajib dari pola-polanya.
+        # Hanya untuk teks ASCII, karena IGNORECASE punya padanan non-ASCII (mis. 'ſ' ~ 's') yang tak tertangkap substring.
+        literals = [required_literals(p) for p in self.group_rules.values()]
+        self.pattern_prefilter = re.compile(trie_regex(set().union(*literals))) if literals and all(literals) else None
+
+    @staticmethod
+    def _compile_patterns(patterns):
+        mergeable = [p for p in patterns if not _UNMERGEABLE.search(p)]
+        separate = [re.compile(p, re.IGNORECASE) for p in patterns if _UNMERGEABLE.search(p)]
+        if not mergeable: return None, {}, separate
+        group_rules = {f"r{i}": p for i, p in enumerate(mergeable)}
+        try:
+            merged = re.compile("|".join(f"(?P<{name}>{p})" for name, p in group_rules.items()), re.IGNORECASE)
+        except re.error:
+            # Mis. inline flag di tengah pola: tetap benar, hanya tidak digabung
+            return None, {}, [re.compile(p, re.IGNORECASE) for p in patterns]
+        return merged, group_rules, separate
+
+    def match(self, text):
+        """Returns the BlacklistMatch of the first rule hit by text (keywords before patterns), or None."""
+        lower_text = text.lower()
+        if self.match_all: return BlacklistMatch("keyword", "")
+        if self.automaton is not None:
+            for _, kw in self.automaton.iter(lower_text): return BlacklistMatch("keyword", kw)
+        elif self.keyword_regex is not None:
+            found = self.keyword_regex.search(lower_text)
+            if found: return BlacklistMatch("keyword", found.group())
+        if self.pattern_regex is not None and (self.pattern_prefilter is None or not lower_text.isascii()
+                                               or self.pattern_prefilter.search(lower_text)):
+            found = self.pattern_regex.search(lower_text)
+            if found: return BlacklistMatch("pattern", self.group_rules[found.lastgroup])
+        for pattern in self.separate_patterns:
+            if pattern.search(lower_text): return BlacklistMatch("pattern", pattern.pattern)
+        return None
+
+    def contains(self, text):
+        return self.match(text) is not None
+
+    __call__ = contains
+
+    def mask(self, names):
+        """List of booleans (True = blacklisted) for names, in order."""
+        return [self.match(name) is not None for name in names]
+
+    def filter(self, names, processes=None, chunk_size=CHUNK_SIZE):
+        """Yields the names that are not blacklisted, in order. Large inputs (a list of at least PARALLEL_THRESHOLD
+        names) are checked on a process pool when processes > 1; otherwise everything runs in-process."""
+        if processes and processes > 1 and isinstance(names, (list, tuple)) and len(names) >= PARALLEL_THRESHOLD:
+            chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+            with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(self.keywords, self.patterns)) as pool:
+                for chunk, flags in zip(chunks, pool.map(_worker_mask, chunks)):
+                    yield from (name for name, blocked in zip(chunk, flags) if not blocked)
+            return
+        iterator = iter(names)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk: return
+            yield from (name for name in chunk if self.match(name) is None)
+
+
+_worker_filter = None
+
+def _init_worker(keywords, patterns):
+    global _worker_filter
+    _worker_filter = BlacklistFilter(keywords, patterns)
+
+def _worker_mask(names):
+    return _worker_filter.mask(names)
+
+
+@lru_cache(maxsize=1)
+def default_filter():
+    """The filter built from processing.blacklist_keywords/blacklist_patterns (edit those before first use)."""
+    return BlacklistFilter()
+
+
+def load_blacklist_config(paths, include_defaults=True):
+    """Builds a BlacklistFilter from user config files, on top of the built-in lists unless include_defaults=False.
+
+    A .json file holds {"keywords": [...], "patterns": [...]}. Any other file is plain text with one keyword per
+    line, 're:' before a regex pattern and '#' for comments. Keywords are lowercased.
+    """
+    keywords = list(blacklist_keywords) if include_defaults else []
+    patterns = list(blacklist_patterns) if include_defaults else []
+    for path in paths:
+        path = Path(path)
+        text = path.read_text(encoding="utf-8")
+        if path.suffix.lower() == ".json":
+            data = json.loads(text)
+            if not isinstance(data, dict): raise ValueError(f"{path}: expected a JSON object with 'keywords'/'patterns'")
+            keywords += [str(kw).lower() for kw in data.get("keywords", []) if str(kw).strip()]
+            patterns += [str(p) for p in data.get("patterns", [])]
+            continue
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"): continue
+            if line.startswith("re:"): patterns.append(line[3:].strip())
+            else: keywords.append(line.lower())
+    for pattern in patterns:
+        try: re.compile(pattern)
+        except re.error as e: raise ValueError(f"Invalid blacklist pattern {pattern!r}: {e}")
+    return BlacklistFilter(keywords, patterns)
+
+def build_blacklist(args):
+    """The blacklist engine for a run: built-in lists plus the user's args.blacklist config file(s), if any."""
+    paths = split_paths(args.blacklist or [])
+    return load_blacklist_config(paths) if paths else default_filter()
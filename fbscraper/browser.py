@@ -0,0 +1,448 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+# --- Import Selenium Modules ---
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+try:
+    import psutil  # opsional: RSS proses Chrome yang akurat untuk laporan memori
+except ImportError:
+    psutil = None
+
+from .processing import DEFAULT_BASE_URL, GROUP_LINKS_XPATH, add_group_record, iter_normalized_group_links
+
+
+# --- Startup Fast Path: cache chromedriver, profil Chrome persisten, cache nama profil ---
+DRIVER_CACHE_TTL = 24 * 3600  # cek ulang versi driver sekali sehari (Chrome bisa update sendiri)
+_driver_path = None
+_driver_path_lock = threading.Lock()
+_profile_names_lock = threading.Lock()
+
+def cache_dir():
+    path = Path(os.environ.get("FBSCRAPER_CACHE_DIR") or Path.home() / ".cache" / "fbscraper")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def resolve_driver_path():
+    """Resolves the chromedriver binary once per process, reusing an on-disk result for DRIVER_CACHE_TTL seconds."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path and Path(_driver_path).exists(): return _driver_path
+        cache_file = cache_dir() / "chromedriver.json"
+        try:
+            cached = json.loads(cache_file.read_text(encoding='utf-8'))
+            if time.time() - cached['resolved_at'] < DRIVER_CACHE_TTL and Path(cached['path']).exists():
+                _driver_path = cached['path']
+                return _driver_path
+        except (OSError, ValueError, KeyError, TypeError): pass
+        _driver_path = ChromeDriverManager().install()
+        try: cache_file.write_text(json.dumps({'path': _driver_path, 'resolved_at': time.time()}), encoding='utf-8')
+        except OSError: pass
+        return _driver_path
+
+def forget_driver_path(failed_path=None):
+    """Drops the in-process and on-disk chromedriver cache (unless another thread already replaced failed_path)."""
+    global _driver_path
+    with _driver_path_lock:
+        if failed_path and _driver_path and _driver_path != failed_path: return
+        _driver_path = None
+        try: (cache_dir() / "chromedriver.json").unlink()
+        except OSError: pass
+
+def profile_dir_for(cookies_path):
+    """Persistent --user-data-dir for one cookies file, so a still-valid session survives between runs."""
+    key = hashlib.sha1(str(Path(cookies_path).resolve()).encode('utf-8')).hexdigest()[:16]
+    return cache_dir() / "profiles" / key
+
+def cached_profile_name(user_id):
+    if not user_id: return None
+    with _profile_names_lock:
+        try: return json.loads((cache_dir() / "profile_names.json").read_text(encoding='utf-8')).get(str(user_id))
+        except (OSError, ValueError): return None
+
+def remember_profile_name(user_id, profile_name):
+    if not user_id or profile_name == "user": return
+    with _profile_names_lock:
+        path = cache_dir() / "profile_names.json"
+        try: names = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError): names = {}
+        names[str(user_id)] = profile_name
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(names, indent=2), encoding='utf-8'); os.replace(tmp_path, path)
+
+def wait_until_ready(driver, timeout=15):
+    WebDriverWait(driver, timeout).until(lambda d: d.execute_script("return document.readyState") == "complete")
+
+# --- Lean Mode: blokir gambar/media/font, yang dibaca scraper hanya teks + href ---
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mpd*", "*video*.fbcdn.net*",
+    "*.woff*", "*.ttf*", "*.otf*",
+]
+LEAN_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+def create_driver(headless=True, profile_dir=None, lean=False, performance_log=False):
+    options = ChromeOptions()
+    if headless: options.add_argument("--headless")
+    if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
+    options.add_argument("--disable-gpu"); options.add_argument("--window-size=1920,1080"); options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage"); options.add_argument("--disable-notifications"); options.add_argument("--lang=en-US,id;q=0.9")
+    # Performance log hanya untuk driver yang dibaca ResourceMonitor (byte yang diterima); driver lain tidak perlu bebannya
+    if performance_log: options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if lean:
+        options.add_experimental_option("prefs", LEAN_CHROME_PREFS)
+        options.add_argument("--blink-settings=imagesEnabled=false"); options.add_argument("--autoplay-policy=user-gesture-required")
+    driver_path = resolve_driver_path()
+    try:
+        driver = webdriver.Chrome(service=webdriver.chrome.service.Service(driver_path), options=options)
+    except WebDriverException:
+        # Chrome bisa update sendiri sehingga driver yang di-cache tidak cocok lagi: resolve ulang sekali sebelum menyerah
+        forget_driver_path(driver_path)
+        driver = webdriver.Chrome(service=webdriver.chrome.service.Service(resolve_driver_path()), options=options)
+    if lean:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URL_PATTERNS})
+    return driver
+
+# Kartu grup yang sudah diekstrak "dikempiskan": media dilepas dan rendering dilewati (content-visibility),
+# tapi node dan tingginya tetap ada, jadi jumlah link dan pemicu infinite-scroll tidak berubah.
+PRUNE_EXTRACTED_JS = """
+const [marker, keep] = arguments;
+const links = document.querySelectorAll('a[' + marker + ']:not([data-fbgs-pruned])');
+let pruned = 0;
+for (let i = 0; i < links.length - keep; i++) {
+    const link = links[i];
+    link.setAttribute('data-fbgs-pruned', '1');
+    const card = link.closest('[role="listitem"]') || link.parentElement;
+    if (!card || card.hasAttribute('data-fbgs-pruned')) continue;
+    card.setAttribute('data-fbgs-pruned', '1');
+    const height = card.getBoundingClientRect().height;
+    card.querySelectorAll('img').forEach(img => { img.removeAttribute('srcset'); img.src = 'data:image/gif;base64,R0lGODlhAQABAAAAACw='; });
+    card.querySelectorAll('video').forEach(video => { video.pause(); video.removeAttribute('src'); video.load(); });
+    card.querySelectorAll('[style*="background-image"]').forEach(el => { el.style.backgroundImage = 'none'; });
+    card.style.contentVisibility = 'hidden';
+    card.style.containIntrinsicSize = 'auto ' + height + 'px';
+    pruned++;
+}
+return pruned;
+"""
+LEAN_PRUNE_KEEP = 30  # kartu terakhir dibiarkan utuh di dekat pemicu infinite-scroll
+
+def prune_extracted_cards(driver, marker=None, keep=LEAN_PRUNE_KEEP):
+    return int(driver.execute_script(PRUNE_EXTRACTED_JS, marker or SEEN_MARKER_ATTR, keep) or 0)
+
+
+class ResourceMonitor(object):
+    """Tracks bytes received (Network.loadingFinished in the performance log) and peak Chrome memory."""
+    def __init__(self, driver):
+        self.driver = driver
+        self.bytes_received = 0; self.peak_rss = 0; self.peak_js_heap = 0
+        if psutil is None:
+            try: driver.execute_cdp_cmd("Performance.enable", {})
+            except Exception: pass
+
+    def chrome_rss(self):
+        try:
+            root = psutil.Process(self.driver.service.process.pid)
+            return sum(p.memory_info().rss for p in [root] + root.children(recursive=True))
+        except Exception:
+            return None
+
+    def sample(self):
+        try: entries = self.driver.get_log('performance')
+        except Exception: entries = []
+        for entry in entries:
+            try: message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError, TypeError): continue
+            if message.get('method') == 'Network.loadingFinished':
+                self.bytes_received += int(message.get('params', {}).get('encodedDataLength', 0))
+        rss = self.chrome_rss() if psutil is not None else None
+        if rss: self.peak_rss = max(self.peak_rss, rss)
+        else:
+            try:
+                metrics = {m['name']: m['value'] for m in self.driver.execute_cdp_cmd("Performance.getMetrics", {})['metrics']}
+                self.peak_js_heap = max(self.peak_js_heap, int(metrics.get('JSHeapTotalSize', 0)))
+            except Exception: pass
+
+    def summary(self):
+        memory = f"peak Chrome RSS {self.peak_rss / 2**20:.1f} MB" if self.peak_rss else f"peak JS heap {self.peak_js_heap / 2**20:.1f} MB (install psutil for process RSS)"
+        return f"{memory}, received {self.bytes_received / 2**20:.2f} MB"
+
+def load_cookies(driver, cookies_path, log, base_url=DEFAULT_BASE_URL):
+    log.verbose(f"Attempting to load cookies from: {cookies_path}")
+    try:
+        with open(cookies_path, 'r', encoding='utf-8') as f:
+            cookies = json.load(f)
+        log.verbose(f"Loaded {len(cookies)} cookies from file.")
+        driver.get(base_url)
+        wait_until_ready(driver)
+        # Profil Chrome persisten: jika sesi akun yang sama masih ada, injeksi cookies tidak perlu
+        user_id = next((str(c.get('value')) for c in cookies if c.get('name') == 'c_user'), None)
+        session_cookie = driver.get_cookie('c_user') if user_id else None
+        if session_cookie and str(session_cookie.get('value')) == user_id:
+            log.verbose("Existing browser session is still valid, skipping cookie injection.")
+            return True
+        for cookie in cookies:
+            if 'sameSite' not in cookie: cookie['sameSite'] = 'Lax'
+            if 'expiry' in cookie and (cookie['expiry'] is None or cookie['expiry'] == -1): del cookie['expiry']
+            elif 'expires' in cookie and isinstance(cookie['expires'], float): cookie['expires'] = int(cookie['expires'])
+            if 'expires' in cookie and 'expiry' not in cookie: cookie['expiry'] = cookie.pop('expires')
+            try: driver.add_cookie(cookie)
+            except Exception: pass
+        log.verbose("Finished adding cookies.")
+        driver.refresh()
+        wait_until_ready(driver)
+        log.verbose("Page refreshed after adding cookies.")
+        return True
+    except Exception as e:
+        log.error(f"Failed during cookie load: {e}")
+        return False
+
+# --- Adaptive Wait: kembali secepat link grup baru muncul, bukan sleep tetap ---
+# MutationObserver (di-throttle) yang selesai saat jumlah link grup atau scrollHeight bertambah, atau saat timeout.
+WAIT_FOR_NEW_CONTENT_JS = """
+const [xpath, prevCount, prevHeight, timeoutMs, done] = arguments;
+const start = performance.now();
+const state = () => ({
+    count: document.evaluate('count(' + xpath + ')', document, null, XPathResult.NUMBER_TYPE, null).numberValue,
+    height: document.body.scrollHeight
+});
+let finished = false, pending = false, observer = null, timer = null;
+const finish = (changed) => {
+    if (finished) return;
+    finished = true; observer.disconnect(); clearTimeout(timer);
+    const s = state();
+    done({changed: changed, count: s.count, height: s.height, waited_ms: performance.now() - start});
+};
+const check = () => { const s = state(); if (s.count > prevCount || s.height > prevHeight) finish(true); };
+observer = new MutationObserver(() => {
+    if (pending || finished) return;
+    pending = true;
+    setTimeout(() => { pending = false; if (!finished) check(); }, 50);
+});
+observer.observe(document.body, {childList: true, subtree: true});
+timer = setTimeout(() => finish(false), timeoutMs);
+check();
+"""
+
+def count_group_links(driver, xpath=GROUP_LINKS_XPATH):
+    return int(driver.execute_script("return document.evaluate('count(' + arguments[0] + ')', document, null, XPathResult.NUMBER_TYPE, null).numberValue;", xpath))
+
+def wait_for_new_content(driver, prev_count, prev_height, timeout):
+    """Blocks until new group links render or scrollHeight grows, at most timeout seconds."""
+    driver.set_script_timeout(timeout + 5)
+    return driver.execute_async_script(WAIT_FOR_NEW_CONTENT_JS, GROUP_LINKS_XPATH, prev_count, prev_height, int(timeout * 1000))
+
+def iter_scroll_steps(driver, scroll_delay, max_scroll, log, adaptive=False, wait_timeout=10.0, end_checks=3, cancel=None, metrics=None):
+    """Scrolls to the bottom repeatedly, yielding the scroll count whenever new content may have rendered.
+
+    With adaptive=True each step waits only until new content appears. scroll_delay is then the minimum
+    per-step budget: the budget follows observed load times, doubles after every check without new content
+    (capped at wait_timeout), and the end of the page is declared after end_checks consecutive empty checks.
+    Each wait is recorded in the 'scroll_wait_seconds' histogram of metrics, if given.
+    """
+    log.verbose("Starting page scroll...")
+    scroll_count = 0
+    last_height = driver.execute_script("return document.body.scrollHeight")
+    last_count = count_group_links(driver) if adaptive else 0
+    unchanged, timeout, wait_times = 0, min(scroll_delay, wait_timeout), []
+    yield scroll_count
+    while scroll_count < max_scroll:
+        if cancel is not None and cancel.is_set(): log.verbose("Scroll interrupted."); break
+        # Setelah cek kosong, geser sedikit ke atas dulu agar pemicu infinite-scroll aktif lagi
+        if unchanged: driver.execute_script("window.scrollBy(0, -400);")
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        if adaptive:
+            result = wait_for_new_content(driver, last_count, last_height, timeout)
+            waited = result['waited_ms'] / 1000; wait_times.append(waited)
+            if metrics: metrics.observe('scroll_wait_seconds', waited)
+            if not result['changed']:
+                unchanged += 1
+                if metrics: metrics.incr('empty_scroll_checks')
+                log.verbose(f"Scroll #{scroll_count + 1}: no new content after {waited:.2f}s (check {unchanged}/{end_checks}).")
+                if unchanged >= end_checks:
+                    log.verbose("Reached bottom of the page."); break
+                timeout = min(wait_timeout, timeout * 2)
+                continue
+            unchanged = 0
+            timeout = min(wait_timeout, max(scroll_delay, waited * 3))
+            log.verbose(f"Scroll #{scroll_count + 1}: new content after {waited:.2f}s (next timeout {timeout:.1f}s).")
+            new_height, last_count = result['height'], int(result['count'])
+        else:
+            time.sleep(scroll_delay)
+            if metrics: metrics.observe('scroll_wait_seconds', scroll_delay)
+            new_height = driver.execute_script("return document.body.scrollHeight")
+            if new_height == last_height:
+                log.verbose("Reached bottom of the page."); break
+        last_height = new_height
+        scroll_count += 1
+        yield scroll_count
+    if wait_times:
+        log.verbose(f"Adaptive waits: {len(wait_times)} checks, total {sum(wait_times):.1f}s, avg {sum(wait_times) / len(wait_times):.2f}s, max {max(wait_times):.2f}s.")
+    log.verbose(f"Scrolling finished after {scroll_count + 1} attempts.")
+
+def scroll_page(driver, scroll_delay, max_scroll, log, **wait_options):
+    """Scrolls the groups list to the end (or max_scroll steps) without extracting; see iter_scroll_steps."""
+    for _ in iter_scroll_steps(driver, scroll_delay, max_scroll, log, **wait_options): pass
+
+# --- Ekstraksi Batch: satu round-trip WebDriver untuk semua link grup ---
+# Mengumpulkan semua pasangan (nama, href) di dalam halaman dan mengembalikannya sebagai satu JSON array.
+# element.text Selenium bernilai '' untuk elemen yang tidak tampil (display:none, visibility:hidden, opacity 0),
+# sedangkan innerText elemen yang tidak di-render justru mengembalikan textContent. Karena itu visibilitas dicek
+# dulu (checkVisibility, atau getClientRects di Chrome lama) agar link tersembunyi tetap dilewati.
+# el.href adalah URL absolut, sama dengan get_attribute('href').
+# Jika arguments[1] diisi, setiap link yang dikembalikan ditandai dengan atribut tersebut (mode streaming).
+BATCH_EXTRACT_JS = """
+const snap = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const shown = el => el.checkVisibility ? el.checkVisibility({opacityProperty: true, visibilityProperty: true}) : el.getClientRects().length > 0;
+const out = [];
+for (let i = 0; i < snap.snapshotLength; i++) {
+    const el = snap.snapshotItem(i);
+    if (arguments[1]) el.setAttribute(arguments[1], '1');
+    out.push([shown(el) ? el.innerText || '' : '', el.href || el.getAttribute('href') || '']);
+}
+return JSON.stringify(out);
+"""
+
+def fetch_group_links_batched(driver, xpath=GROUP_LINKS_XPATH):
+    """Returns every (name, href) pair matching xpath using a single execute_script call."""
+    return json.loads(driver.execute_script(BATCH_EXTRACT_JS, xpath) or "[]")
+
+# Atribut penanda link yang sudah diekstrak, supaya tiap langkah scroll hanya mengirim link baru
+SEEN_MARKER_ATTR = "data-fbgs-seen"
+
+def fetch_new_group_links(driver, marker=SEEN_MARKER_ATTR):
+    """Returns only links not extracted by a previous call, marking them as seen in the page."""
+    return json.loads(driver.execute_script(BATCH_EXTRACT_JS, f"{GROUP_LINKS_XPATH}[not(@{marker})]", marker) or "[]")
+
+def fetch_group_links_per_element(driver, xpath=GROUP_LINKS_XPATH, cancel=None):
+    """Legacy path: two WebDriver round trips (text + href) per link element."""
+    for element in driver.find_elements(By.XPATH, xpath):
+        if cancel is not None and cancel.is_set(): break
+        try: yield element.text, element.get_attribute('href')
+        except Exception: pass
+
+def record_extraction(metrics, seconds, seen, valid, added):
+    """Extraction latency plus link counters: duplicates point at an already known group, skipped ones at no group."""
+    metrics.observe('extract_seconds', seconds)
+    metrics.incr('links_seen', seen); metrics.incr('duplicate_links', valid - added); metrics.incr('skipped_links', seen - valid)
+
+def stream_group_names_and_urls(driver, group_data, scroll_delay, max_scroll, log, base_url=DEFAULT_BASE_URL, cancel=None, prune=False, on_step=None, metrics=None, stop_when=None, blacklist=None, **wait_options):
+    """Scrolls the page and yields (group_id, name, url) for each new group right after the step that rendered it,
+    and again for a known group whose blacklisted name is replaced by a clean one (see add_group_record).
+
+    prune=True collapses already-extracted cards after each step and on_step(scroll_count) is called once the
+    step's groups have been yielded. metrics, if given, receives the 'extract_seconds' histogram and the
+    links_seen / duplicate_links counters. Scrolling stops early once stop_when(scroll_count), checked after each
+    step, returns True.
+    """
+    log.verbose("Streaming extraction enabled: extracting new links after every scroll step.")
+
+    def take_new():
+        added = 0
+        start = time.perf_counter()
+        pairs = fetch_new_group_links(driver)
+        changed, valid = [], 0
+        for group_id, group_name, group_url in iter_normalized_group_links(pairs, base_url):
+            valid += 1
+            new = group_id not in group_data
+            if add_group_record(group_data, group_id, group_name, group_url, blacklist):
+                added += new
+                changed.append((group_id, group_name, group_url))
+        if metrics: record_extraction(metrics, time.perf_counter() - start, len(pairs), valid, added)
+        yield from changed
+        if added: log.verbose(f"+{added} new groups (total {len(group_data)}).")
+        if prune:
+            pruned = prune_extracted_cards(driver)
+            if pruned: log.verbose(f"Collapsed {pruned} extracted group cards.")
+
+    for scroll_count in iter_scroll_steps(driver, scroll_delay, max_scroll, log, cancel=cancel, metrics=metrics, **wait_options):
+        yield from take_new()
+        if on_step: on_step(scroll_count)
+        if stop_when and stop_when(scroll_count):
+            log.verbose(f"Stopping early after scroll #{scroll_count}."); return
+    # Langkah terakhir: link yang ter-render setelah scroll final
+    if cancel is None or not cancel.is_set(): yield from take_new()
+
+# Snapshot arsip: seluruh page_source, atau hanya outerHTML semua link /groups/ (jauh lebih kecil)
+SNAPSHOT_ANCHORS_XPATH = "//a[contains(@href, '/groups/')]"
+SNAPSHOT_ANCHORS_JS = """
+const snap = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const out = [];
+for (let i = 0; i < snap.snapshotLength; i++) out.push(snap.snapshotItem(i).outerHTML);
+return out.join('\\n');
+"""
+
+def capture_page_html(driver, kind="page"):
+    """HTML for a replay snapshot: the full page_source, or with kind='anchors' only the group link elements."""
+    if kind == "anchors":
+        return "<html><body>\n" + (driver.execute_script(SNAPSHOT_ANCHORS_JS, SNAPSHOT_ANCHORS_XPATH) or "") + "\n</body></html>"
+    return driver.page_source
+
+def extract_group_names_and_urls(driver, group_data, log, batched=True, base_url=DEFAULT_BASE_URL, cancel=None, metrics=None, blacklist=None):
+    log.verbose("Extracting group names and URLs...")
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.XPATH, GROUP_LINKS_XPATH)))
+        start = time.perf_counter()
+        pairs = list(fetch_group_links_batched(driver) if batched else fetch_group_links_per_element(driver, cancel=cancel))
+        valid = list(iter_normalized_group_links(pairs, base_url))
+        newly_added = 0
+        for group_id, group_name, group_url in valid:
+            newly_added += group_id not in group_data
+            add_group_record(group_data, group_id, group_name, group_url, blacklist)
+        if metrics: record_extraction(metrics, time.perf_counter() - start, len(pairs), len(valid), newly_added)
+        log.verbose(f"Extracted {newly_added} new unique groups.\n")
+    except Exception:
+        log.verbose("No group link elements found.")
+
+
+# --- FUNGSI BARU: Untuk mengambil nama profil ---
+def get_profile_name(driver, log, base_url=DEFAULT_BASE_URL):
+    """Navigates to the user's profile page and extracts their name."""
+    log.info("Navigating to profile page to get user name...")
+    try:
+        driver.get(f"{base_url}/me/")
+        # Menggunakan XPath yang lebih stabil untuk menemukan H1 di dalam area utama halaman
+        h1_xpath = "//div[@role='main']//h1"
+        wait_time = 20
+        h1_element = WebDriverWait(driver, wait_time).until(
+            EC.presence_of_element_located((By.XPATH, h1_xpath))
+        )
+
+        # Menggunakan JavaScript untuk mendapatkan teks utama dari H1, tanpa teks tambahan di dalam <span>
+        full_name = driver.execute_script("return arguments[0].firstChild.textContent.trim();", h1_element)
+
+        if full_name:
+            log.info(f"Profile name found: {full_name}")
+            # Membersihkan nama dari karakter yang tidak valid untuk nama file
+            sanitized_name = re.sub(r'[\s\W]+', '', full_name)
+            return sanitized_name
+        else:
+            log.warning("Could not extract profile name text.")
+            return "user"
+
+    except (TimeoutException, WebDriverException):
+        log.warning("Could not find profile name element. Using default 'user'.")
+        return "user" # Default name jika gagal
+    except Exception as e:
+        log.error(f"An unexpected error occurred while getting profile name: {e}")
+        return "user"
+
+def wait_for_groups_page(driver, log, wait_time=30):
+    log.verbose(f"Waiting up to {wait_time}s for groups page...")
+    WebDriverWait(driver, wait_time).until(EC.presence_of_element_located((By.XPATH, "//h1[contains(., 'Grup')] | //h1[contains(., 'Groups')]")))
+    log.verbose("Groups page loaded.")
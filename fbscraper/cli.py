@@ -0,0 +1,140 @@
+"""Headless command line for the group scraper: python -m fbscraper --cookies a.json [b.json ...]
+
+Browserless re-extraction of archived page snapshots: python -m fbscraper --replay snapshots/ [--blacklist ...]
+"""
+import argparse
+import codecs
+import json
+import signal
+import sys
+from pathlib import Path
+
+from .processing import DEFAULT_BASE_URL, split_paths
+
+# Selenium baru diimpor (lewat fbscraper.jobs) setelah argumen lolos validasi,
+# jadi --help dan --check tetap instan dan tidak butuh browser.
+
+
+def build_parser():
+    # Default sama dengan nilai awal di GUI (FacebookScraperApp)
+    parser = argparse.ArgumentParser(prog="python -m fbscraper", description="Scrape joined Facebook groups (names + URLs) using exported cookies.")
+    parser.add_argument("--cookies", nargs="+", metavar="FILE", help="Cookies JSON file(s); one scraping job per file (required unless --replay).")
+    parser.add_argument("--output", default="groups_data.csv", help="Output CSV path (default: %(default)s).")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=True, help="Run Chrome without a window (default: on).")
+    parser.add_argument("--reuse-profile", action=argparse.BooleanOptionalAction, default=False, help="Keep a persistent Chrome profile per cookies file so valid sessions skip cookie injection (default: off).")
+    parser.add_argument("--verbose", action=argparse.BooleanOptionalAction, default=True, help="Verbose logging (default: on).")
+    parser.add_argument("--stream", action=argparse.BooleanOptionalAction, default=True, help="Extract new links after every scroll step (default: on).")
+    parser.add_argument("--resume", action=argparse.BooleanOptionalAction, default=False, help="Reload the groups journaled by a previous, unfinished run and continue (default: off).")
+    parser.add_argument("--lean", action=argparse.BooleanOptionalAction, default=False, help="Block images/media/fonts and collapse extracted group cards (default: off).")
+    parser.add_argument("--delta", action=argparse.BooleanOptionalAction, default=False, help="Incremental re-scrape: stop scrolling once only already-known groups appear and write an added/removed diff (default: off).")
+    parser.add_argument("--delta-stop", type=int, default=3, metavar="N", help="Consecutive scroll batches with only known groups before a delta run stops (default: %(default)s).")
+    parser.add_argument("--known", metavar="FILE", help="Known groups for --delta (.jsonl index, output .csv, or one URL per line); default: the per-profile index of the last run.")
+    parser.add_argument("--enrich", action=argparse.BooleanOptionalAction, default=False, help="Visit each group's About page and add Members/Privacy/Activity columns to the CSV (default: off).")
+    parser.add_argument("--enrich-workers", type=int, default=2, metavar="N", help="Browsers per account used for enrichment (default: %(default)s).")
+    parser.add_argument("--enrich-rps", type=float, default=1.0, metavar="R", help="Maximum group page requests per second per account (default: %(default)s).")
+    parser.add_argument("--enrich-ttl", type=float, default=168, metavar="HOURS", help="How long fetched group metadata stays cached (default: %(default)s).")
+    parser.add_argument("--enrich-cache", metavar="FILE", help="SQLite metadata cache shared by all accounts (default: group_meta.sqlite in the fbscraper cache dir).")
+    parser.add_argument("--scroll-delay", type=float, default=2.0, help="Seconds to wait per scroll; minimum budget with adaptive waits (default: %(default)s).")
+    parser.add_argument("--max-scroll", type=int, default=50, help="Maximum scroll attempts (default: %(default)s).")
+    parser.add_argument("--adaptive-wait", action=argparse.BooleanOptionalAction, default=True, help="Wait only until new content appears (default: on).")
+    parser.add_argument("--wait-timeout", type=float, default=10.0, help="Upper bound per adaptive wait in seconds (default: %(default)s).")
+    parser.add_argument("--end-checks", type=int, default=3, help="Consecutive empty checks before the end of the page is assumed (default: %(default)s).")
+    parser.add_argument("--workers", type=int, default=1, help="Concurrent Chrome sessions (default: %(default)s).")
+    parser.add_argument("--export", nargs="+", choices=["jsonl", "sqlite"], default=[], help="Extra output formats written next to the CSV.")
+    parser.add_argument("--blacklist", nargs="+", metavar="FILE", help="Extra blacklist config file(s): .json with keywords/patterns, or text with one keyword per line and 're:' for regexes.")
+    parser.add_argument("--prometheus", metavar="FILE", help="Also write run metrics in Prometheus text format (e.g. for node_exporter's textfile collector).")
+    parser.add_argument("--snapshot", choices=["page", "anchors"], help="Archive the scrolled groups page for --replay: the full page source or only the group links (gzip).")
+    parser.add_argument("--snapshot-dir", metavar="DIR", help="Where snapshots are saved (default: 'snapshots' next to the output).")
+    parser.add_argument("--replay", nargs="+", metavar="PATH", help="Re-extract groups from snapshot file(s)/directories without a browser, then filter and write the outputs.")
+    parser.add_argument("--xpath", help="Group link XPath for --replay (default: the scraper's; a custom one needs lxml).")
+    parser.add_argument("--processes", type=int, help="Worker processes for --replay (default: CPU count).")
+    parser.add_argument("--encoding", default="utf-8", help="Output file encoding (default: %(default)s).")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help=argparse.SUPPRESS)
+    parser.add_argument("--check", action="store_true", help="Validate the configuration and exit without starting a browser.")
+    return parser
+
+
+def validate_args(args):
+    """Returns a list of human-readable configuration errors (empty when args are usable)."""
+    errors = []
+    if not args.cookies and not args.replay: errors.append("--cookies is required (or --replay to re-extract snapshots)")
+    for path in split_paths(args.cookies or []):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            if not isinstance(cookies, list) or not all(isinstance(c, dict) for c in cookies):
+                errors.append(f"{path}: expected a JSON list of cookie objects")
+        except FileNotFoundError:
+            errors.append(f"{path}: file not found")
+        except (OSError, ValueError) as e:
+            errors.append(f"{path}: {e}")
+    if args.scroll_delay <= 0: errors.append("--scroll-delay must be > 0")
+    if args.max_scroll < 1: errors.append("--max-scroll must be >= 1")
+    if args.wait_timeout <= 0: errors.append("--wait-timeout must be > 0")
+    if args.end_checks < 1: errors.append("--end-checks must be >= 1")
+    if args.workers < 1: errors.append("--workers must be >= 1")
+    if args.enrich_workers < 1: errors.append("--enrich-workers must be >= 1")
+    if args.enrich_rps <= 0: errors.append("--enrich-rps must be > 0")
+    if args.enrich_ttl < 0: errors.append("--enrich-ttl must be >= 0")
+    if args.delta_stop < 1: errors.append("--delta-stop must be >= 1")
+    if args.known and not Path(args.known).is_file(): errors.append(f"--known: {args.known}: file not found")
+    try: codecs.lookup(args.encoding)
+    except LookupError: errors.append(f"--encoding: unknown encoding '{args.encoding}'")
+    if args.blacklist:
+        from .blacklist import load_blacklist_config
+        try: load_blacklist_config(args.blacklist)
+        except (OSError, ValueError) as e: errors.append(f"--blacklist: {e}")
+    if args.replay:
+        missing = [p for p in args.replay if not Path(p).exists()]
+        if missing: errors.append(f"--replay: not found: {', '.join(missing)}")
+        if args.processes is not None and args.processes < 1: errors.append("--processes must be >= 1")
+        if args.xpath:
+            from .replay import available_parser
+            try: available_parser(args.xpath)
+            except RuntimeError as e: errors.append(f"--xpath: {e}")
+    if Path(args.output).is_dir(): errors.append(f"--output: '{args.output}' is a directory")
+    return errors
+
+
+def run_replay(args, reporter):
+    """--replay: no browser, only extraction + blacklist + outputs from archived snapshots."""
+    from .blacklist import build_blacklist
+    from .processing import GROUP_LINKS_XPATH
+    from .replay import replay_snapshots
+    if args.check:
+        reporter.info("Configuration OK.")
+        return 0
+    summary = replay_snapshots(args.replay, args.output, args.encoding, reporter, build_blacklist(args),
+                               formats=("csv", "txt", *args.export), xpath=args.xpath or GROUP_LINKS_XPATH, processes=args.processes)
+    return 0 if summary else 1
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    errors = validate_args(args)
+    if errors:
+        for error in errors: sys.stderr.write(f"[ERROR] {error}\n")
+        return 2
+
+    from .reporting import ConsoleReporter, log_config_summary
+    reporter = ConsoleReporter(args.verbose)
+    if args.replay: return run_replay(args, reporter)
+    log_config_summary(args, reporter)
+    if args.check:
+        reporter.info("Configuration OK.")
+        return 0
+
+    from . import jobs
+    # Ctrl+C pertama: berhenti dengan rapi (data yang sudah ada tetap disimpan); kedua kali: paksa keluar
+    def on_sigint(signum, frame):
+        reporter.write("\nCTRL+C detected. Attempting graceful exit...\n", "warning")
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        jobs.cancel_event.set()
+    signal.signal(signal.SIGINT, on_sigint)
+
+    reporter.info("Scraping process started...")
+    job_list = jobs.run_scraping_jobs(args, reporter)
+    message, _ = jobs.overall_status(job_list)
+    reporter.info(f"Finished: {message}")
+    if jobs.cancel_event.is_set(): return 130
+    return 0 if all(job.status == "Completed" for job in job_list) else 1
@@ -0,0 +1,88 @@
+import csv
+import os
+from pathlib import Path
+
+from .processing import add_group_record, canonical_group_id, iter_csv_records
+from .store import GroupStore, iter_journal
+
+# Delta re-scrape: grup yang sudah dikenal dari run sebelumnya (index per profil) dimuat ke dict untuk lookup O(1).
+# Scroll berhenti setelah sejumlah batch berturut-turut hanya berisi grup lama; hasilnya diff added/removed.
+DELTA_STOP_BATCHES = 3  # batch berturut-turut tanpa grup baru sebelum scroll dihentikan
+
+
+def known_index_path(output_path, profile_name="user"):
+    """Per-profile index of every group known after the last run, next to the output CSV."""
+    output = Path(output_path)
+    return output.with_name(f"{output.stem}_known_{profile_name}.jsonl")
+
+def diff_path(output_path, profile_name="user"):
+    output = Path(output_path)
+    return output.with_name(f"{output.stem}_diff_{profile_name}.csv")
+
+def iter_known_records(path, encoding='utf-8'):
+    """(group_id, name, url) from a known-groups source: a .jsonl index/journal, an output .csv, or a text file
+    with one group URL per line (name left empty)."""
+    path = Path(path)
+    if path.suffix == '.jsonl':
+        yield from iter_journal(path)
+    elif path.suffix == '.csv':
+        yield from iter_csv_records(path, encoding)
+    else:
+        with open(path, 'r', encoding=encoding, errors='ignore') as f:
+            for line in f:
+                url = line.strip()
+                group_id = canonical_group_id(url) if url else None
+                if group_id: yield group_id, '', url
+
+def load_known_groups(candidates, encoding='utf-8'):
+    """Loads the first existing candidate path. Returns ({group_id: (name, url)}, path), or ({}, None)."""
+    for path in candidates:
+        if path and Path(path).is_file():
+            known = {}
+            for group_id, name, url in iter_known_records(path, encoding): add_group_record(known, group_id, name, url)
+            return known, Path(path)
+    return {}, None
+
+def write_known_index(path, records):
+    """Atomically replaces the known-groups index with records ((group_id, name, url) tuples, journal format)."""
+    tmp_path = Path(f"{path}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for group_id, name, url in records: f.write(GroupStore._line(group_id, name, url))
+        f.flush(); os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def write_diff(path, added, removed, encoding='utf-8'):
+    """CSV of Change,GroupName,GroupURL rows ('added' / 'removed'), each part sorted by name."""
+    with open(path, 'w', newline='', encoding=encoding) as f:
+        writer = csv.writer(f)
+        writer.writerow(['Change', 'GroupName', 'GroupURL'])
+        for change, groups in (('added', added), ('removed', removed)):
+            for name, url in sorted(groups.values()): writer.writerow([change, name, url])
+
+
+class DeltaTracker(object):
+    """Counts consecutive scroll batches that contain only known groups and decides when scrolling can stop."""
+    def __init__(self, known, stop_after=DELTA_STOP_BATCHES):
+        self.known = known
+        self.stop_after = stop_after
+        self.batch_seen = self.batch_new = 0
+        self.streak = 0
+        self.stopped_early = False
+
+    def observe(self, group_id):
+        self.batch_seen += 1
+        if group_id not in self.known: self.batch_new += 1
+
+    def end_batch(self, scroll_count=None):
+        """Closes the current batch; returns True once stop_after batches in a row held only known groups."""
+        # Batch kosong (belum ada render baru) tidak dihitung ke arah mana pun
+        if self.batch_seen: self.streak = 0 if self.batch_new else self.streak + 1
+        self.batch_seen = self.batch_new = 0
+        if self.known and self.streak >= self.stop_after: self.stopped_early = True
+        return self.stopped_early
+
+    def added(self, group_data):
+        return {group_id: group for group_id, group in group_data.items() if group_id not in self.known}
+
+    def removed(self, group_data):
+        return {group_id: group for group_id, group in self.known.items() if group_id not in group_data}
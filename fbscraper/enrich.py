@@ -0,0 +1,153 @@
+import queue
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .browser import cache_dir
+from .processing import DEFAULT_BASE_URL
+
+# Enrichment: halaman /about/ tiap grup dikunjungi oleh pool driver (satu thread per driver) dengan batas
+# request/detik bersama. Hasil parse (anggota, privasi, aktivitas) di-cache di SQLite per ID grup dengan TTL,
+# sehingga run ulang dan akun lain yang berbagi grup tidak mengambil ulang.
+ENRICH_CACHE_TTL = 7 * 24 * 3600
+ENRICH_RPS = 1.0
+ENRICH_WORKERS = 2
+ENRICH_PAGE_TIMEOUT = 15
+
+MEMBERS_RE = re.compile(r"([\d][\d.,]*)\s*(k|rb|ribu|m|jt|juta)?\s+(?:members|member|anggota)\b", re.IGNORECASE)
+PRIVACY_RE = re.compile(r"\b(public|private)\s+group\b|\bgrup\s+(publik|privat)\b", re.IGNORECASE)
+ACTIVITY_RE = re.compile(
+    r"(?:\d[\d.,]*\s*(?:k|rb|ribu)?|no)\s+new\s+posts?\s+today|\d[\d.,]*\s*(?:k|rb|ribu)?\s+posts?\s+in\s+the\s+last\s+(?:month|week)"
+    r"|\d[\d.,]*\s*(?:rb|ribu)?\s+postingan\s+baru\s+hari\s+ini|\d[\d.,]*\s*(?:rb|ribu)?\s+postingan\s+dalam\s+(?:sebulan|seminggu)\s+terakhir",
+    re.IGNORECASE)
+MULTIPLIERS = {'k': 1_000, 'rb': 1_000, 'ribu': 1_000, 'm': 1_000_000, 'jt': 1_000_000, 'juta': 1_000_000}
+
+
+def parse_count(number, suffix=None):
+    """'12K' -> 12000, '1.2M' / '1,2 jt' -> 1200000, '1,234' -> 1234."""
+    if suffix:
+        return int(round(float(number.replace(',', '.')) * MULTIPLIERS[suffix.lower()]))
+    return int(re.sub(r"[.,]", "", number))
+
+def parse_group_about(text):
+    """Member count, privacy ('public'/'private') and the activity line from the visible text of a group page."""
+    members = MEMBERS_RE.search(text)
+    privacy = PRIVACY_RE.search(text)
+    activity = ACTIVITY_RE.search(text)
+    try: member_count = parse_count(members.group(1), members.group(2)) if members else None
+    except ValueError: member_count = None
+    kind = (privacy.group(1) or privacy.group(2)).lower() if privacy else None
+    return {
+        'members': member_count,
+        'privacy': {'publik': 'public', 'privat': 'private'}.get(kind, kind),
+        'activity': re.sub(r"\s+", " ", activity.group(0)).strip() if activity else None,
+    }
+
+
+class GroupMetaCache(object):
+    """On-disk metadata cache keyed by canonical group ID; entries older than ttl seconds are evicted on open."""
+    def __init__(self, path=None, ttl=ENRICH_CACHE_TTL):
+        self.path = str(path or cache_dir() / "group_meta.sqlite")
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS group_meta (group_id TEXT PRIMARY KEY, members INTEGER, privacy TEXT, activity TEXT, fetched_at REAL NOT NULL)")
+        self.evicted = self.evict()
+
+    def evict(self):
+        with self.lock, self.db:
+            return self.db.execute("DELETE FROM group_meta WHERE fetched_at < ?", (time.time() - self.ttl,)).rowcount
+
+    def get_many(self, group_ids):
+        """{group_id: meta} for the cached, unexpired entries among group_ids."""
+        found, ids, cutoff = {}, list(group_ids), time.time() - self.ttl
+        with self.lock:
+            for i in range(0, len(ids), 500):  # batas parameter SQLite
+                chunk = ids[i:i + 500]
+                rows = self.db.execute(f"SELECT group_id, members, privacy, activity FROM group_meta WHERE fetched_at >= ? AND group_id IN ({','.join('?' * len(chunk))})", (cutoff, *chunk))
+                for group_id, members, privacy, activity in rows: found[group_id] = {'members': members, 'privacy': privacy, 'activity': activity}
+        return found
+
+    def put(self, group_id, meta):
+        with self.lock, self.db:
+            self.db.execute("INSERT OR REPLACE INTO group_meta VALUES (?, ?, ?, ?, ?)", (group_id, meta.get('members'), meta.get('privacy'), meta.get('activity'), time.time()))
+
+    def close(self):
+        with self.lock: self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RateLimiter(object):
+    """Spaces calls to wait() at least 1/rps seconds apart across all threads."""
+    def __init__(self, rps):
+        self.interval = 1.0 / rps if rps and rps > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def wait(self, cancel=None):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot); self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            if cancel is not None: cancel.wait(delay)
+            else: time.sleep(delay)
+
+
+GROUP_TEXT_JS = "const main = document.querySelector(\"[role='main']\"); return (main || document.body).innerText;"
+
+def fetch_group_meta(driver, group_id, base_url=DEFAULT_BASE_URL, timeout=ENRICH_PAGE_TIMEOUT):
+    """Opens the group's About page and parses its metadata from the rendered text (one execute_script call)."""
+    driver.get(f"{base_url}/groups/{group_id}/about/")
+    WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.XPATH, "//div[@role='main']")))
+    return parse_group_about(driver.execute_script(GROUP_TEXT_JS) or "")
+
+def enrich_groups(group_ids, drivers, cache, log, base_url=DEFAULT_BASE_URL, rps=ENRICH_RPS, cancel=None, metrics=None):
+    """Returns {group_id: meta} for group_ids: cached entries first, the rest fetched by one thread per driver.
+
+    Failed fetches are logged and left out (not cached), so the next run retries them.
+    """
+    group_ids = list(group_ids)
+    results = cache.get_many(group_ids)
+    todo = queue.Queue()
+    for group_id in group_ids:
+        if group_id not in results: todo.put(group_id)
+    if metrics: metrics.set('enrich_cache_hits', len(results))
+    log.info(f"Enrichment: {len(results)} of {len(group_ids)} groups cached, fetching {todo.qsize()} with {len(drivers)} browser(s) at <= {rps:g} req/s.")
+    limiter, results_lock = RateLimiter(rps), threading.Lock()
+
+    def work(driver):
+        while cancel is None or not cancel.is_set():
+            try: group_id = todo.get_nowait()
+            except queue.Empty: return
+            limiter.wait(cancel)
+            if cancel is not None and cancel.is_set(): return
+            start = time.perf_counter()
+            try:
+                meta = fetch_group_meta(driver, group_id, base_url)
+            except (TimeoutException, WebDriverException) as e:
+                log.verbose(f"Enrichment failed for group {group_id}: {getattr(e, 'msg', None) or e}")
+                if metrics: metrics.incr('enrich_errors')
+                continue
+            if metrics: metrics.observe('enrich_seconds', time.perf_counter() - start); metrics.incr('enrich_fetched')
+            cache.put(group_id, meta)
+            with results_lock:
+                results[group_id] = meta
+                done = len(results)
+            if done % 25 == 0: log.verbose(f"Enrichment: {done}/{len(group_ids)} groups.")
+
+    with ThreadPoolExecutor(max_workers=max(1, len(drivers))) as pool:
+        for future in [pool.submit(work, driver) for driver in drivers]: future.result()
+    return results
@@ -0,0 +1,247 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+import queue
+import signal
+import sys
+import threading
+
+from . import jobs
+from .logpump import QueueReporter, TkLogPump
+from .metrics import format_stats
+from .reporting import log_config_summary
+
+
+# --- Redirect stdout/stderr ke antrean log (bukan langsung ke widget Tk) ---
+class TextRedirector(object):
+    def __init__(self, records, tag="stdout"):
+        self.records = records; self.tag = tag; self.stdout = sys.stdout
+    def write(self, str_val):
+        self.records.put(("log", str_val, self.tag)); self.stdout.write(str_val)
+    def flush(self):
+        self.stdout.flush()
+
+def safe_quit(log_widget, is_gui_initiated=False):
+    if not is_gui_initiated:
+        if jobs.active_jobs:
+            log_widget.insert(tk.END, "\nCTRL+C detected. Attempting graceful exit...\n", ("warning",))
+    else:
+        log_widget.insert(tk.END, "Stop button pressed. Attempting graceful exit...\n", ("warning",))
+    jobs.cancel_all_jobs()
+    # Fitur baru akan menyimpan file dengan nama profil, jadi tidak perlu save di sini.
+    if not is_gui_initiated: sys.exit(0)
+
+def run_scraper(args, app):
+    """Worker-thread entry point: never touches Tk directly, everything goes through app.log_queue."""
+    reporter = QueueReporter(app.log_queue, args.verbose, log_file=args.log_file or None)
+    original_stdout, original_stderr = sys.stdout, sys.stderr
+    sys.stdout = TextRedirector(app.log_queue, "stdout"); sys.stderr = TextRedirector(app.log_queue, "error")
+    reporter.clear()
+    reporter.info("Scraping process started..."); log_config_summary(args, reporter)
+    try:
+        job_list = jobs.run_scraping_jobs(args, reporter)
+        if len(job_list) > 1: reporter.status(*jobs.overall_status(job_list))
+    except Exception as e:
+        reporter.write(f"\n[FATAL ERROR] An unexpected error occurred: {e}\n", "error")
+        reporter.status("Fatal Error", "red")
+    finally:
+        sys.stdout = original_stdout; sys.stderr = original_stderr
+
+# --- Kelas GUI FacebookScraperApp ---
+class FacebookScraperApp:
+    def __init__(self, master):
+        self.master = master
+        master.title("Facebook Group Scraper")
+        master.geometry("800x700")
+        self.style = ttk.Style()
+        self.style.configure("TFrame", padding=10)
+        self.style.configure("TLabel", font=('Arial', 10))
+        self.style.configure("TButton", font=('Arial', 10, 'bold'))
+        self.cookies_path_var = tk.StringVar(value='www.facebook.com.cookies.json')
+        self.output_path_var = tk.StringVar(value='groups_data.csv')
+        self.headless_var = tk.BooleanVar(value=True)
+        self.verbose_var = tk.BooleanVar(value=True)
+        self.reuse_profile_var = tk.BooleanVar(value=False)
+        self.stream_var = tk.BooleanVar(value=True)
+        self.lean_var = tk.BooleanVar(value=False)
+        self.resume_var = tk.BooleanVar(value=False)
+        self.delta_var = tk.BooleanVar(value=False)
+        self.delta_stop_var = tk.IntVar(value=3)
+        self.enrich_var = tk.BooleanVar(value=False)
+        self.snapshot_var = tk.BooleanVar(value=False)
+        self.enrich_workers_var = tk.IntVar(value=2)
+        self.enrich_rps_var = tk.DoubleVar(value=1.0)
+        self.export_jsonl_var = tk.BooleanVar(value=False)
+        self.export_sqlite_var = tk.BooleanVar(value=False)
+        self.scroll_delay_var = tk.DoubleVar(value=2.0)
+        self.max_scroll_var = tk.IntVar(value=50)
+        self.adaptive_wait_var = tk.BooleanVar(value=True)
+        self.wait_timeout_var = tk.DoubleVar(value=10.0)
+        self.end_checks_var = tk.IntVar(value=3)
+        self.workers_var = tk.IntVar(value=1)
+        self.encoding_var = tk.StringVar(value='utf-8')
+        self.max_log_lines_var = tk.IntVar(value=5000)
+        self.log_file_var = tk.StringVar(value='')
+        self.blacklist_path_var = tk.StringVar(value='')
+        self.prometheus_path_var = tk.StringVar(value='')
+        self.stats_jobs = {}  # job -> ScrapeJob, untuk panel statistik run
+        self.input_widgets = []
+        self.create_widgets()
+        self.log_queue = queue.Queue()
+        self.log_pump = TkLogPump(self.log_text, self.log_queue, on_status=self.on_job_status, on_progress=self.on_job_progress, max_lines=self.max_log_lines_var.get())
+        self.log_pump.start()
+        signal.signal(signal.SIGINT, lambda s, f: safe_quit(self.log_text, False))
+
+    def create_widgets(self):
+        input_frame = ttk.LabelFrame(self.master, text="Configuration", padding="10")
+        input_frame.pack(padx=10, pady=10, fill="x")
+        ttk.Label(input_frame, text="Cookies File(s):").grid(row=0, column=0, sticky="w", pady=2)
+        cookies_entry = ttk.Entry(input_frame, textvariable=self.cookies_path_var, width=50)
+        cookies_entry.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
+        cookies_btn = ttk.Button(input_frame, text="Browse", command=self.browse_cookies)
+        cookies_btn.grid(row=0, column=2, pady=2)
+        ttk.Label(input_frame, text="Output File (CSV):").grid(row=1, column=0, sticky="w", pady=2)
+        output_entry = ttk.Entry(input_frame, textvariable=self.output_path_var, width=50)
+        output_entry.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
+        output_btn = ttk.Button(input_frame, text="Browse", command=self.browse_output)
+        output_btn.grid(row=1, column=2, pady=2)
+        headless_cb = ttk.Checkbutton(input_frame, text="Headless Mode", variable=self.headless_var)
+        headless_cb.grid(row=2, column=0, sticky="w", pady=2)
+        verbose_cb = ttk.Checkbutton(input_frame, text="Verbose Logging", variable=self.verbose_var)
+        verbose_cb.grid(row=2, column=1, sticky="w", pady=2)
+        stream_cb = ttk.Checkbutton(input_frame, text="Streaming Extraction", variable=self.stream_var)
+        stream_cb.grid(row=2, column=2, sticky="w", pady=2)
+        reuse_profile_cb = ttk.Checkbutton(input_frame, text="Reuse Browser Profile", variable=self.reuse_profile_var)
+        reuse_profile_cb.grid(row=5, column=1, sticky="w", pady=2)
+        lean_cb = ttk.Checkbutton(input_frame, text="Lean Mode (no media)", variable=self.lean_var)
+        lean_cb.grid(row=5, column=2, sticky="w", pady=2)
+        resume_cb = ttk.Checkbutton(input_frame, text="Resume Previous Run", variable=self.resume_var)
+        resume_cb.grid(row=4, column=2, sticky="w", pady=2)
+        delta_cb = ttk.Checkbutton(input_frame, text="Delta Re-Scrape", variable=self.delta_var)
+        delta_cb.grid(row=3, column=2, sticky="w", pady=2)
+        enrich_cb = ttk.Checkbutton(input_frame, text="Enrich Group Details", variable=self.enrich_var)
+        enrich_cb.grid(row=8, column=2, sticky="w", pady=2)
+        snapshot_cb = ttk.Checkbutton(input_frame, text="Save Page Snapshot", variable=self.snapshot_var)
+        snapshot_cb.grid(row=9, column=2, sticky="w", pady=2)
+        export_jsonl_cb = ttk.Checkbutton(input_frame, text="Also Export JSONL", variable=self.export_jsonl_var)
+        export_jsonl_cb.grid(row=6, column=2, sticky="w", pady=2)
+        export_sqlite_cb = ttk.Checkbutton(input_frame, text="Also Export SQLite", variable=self.export_sqlite_var)
+        export_sqlite_cb.grid(row=7, column=2, sticky="w", pady=2)
+        ttk.Label(input_frame, text="Scroll Delay (s):").grid(row=3, column=0, sticky="w", pady=2)
+        scroll_delay_spinbox = ttk.Spinbox(input_frame, from_=0.1, to_=10.0, increment=0.1, textvariable=self.scroll_delay_var, width=10, format="%.1f")
+        scroll_delay_spinbox.grid(row=3, column=1, padx=5, pady=2, sticky="w")
+        ttk.Label(input_frame, text="Max Scroll:").grid(row=4, column=0, sticky="w", pady=2)
+        max_scroll_spinbox = ttk.Spinbox(input_frame, from_=1, to_=1000, increment=1, textvariable=self.max_scroll_var, width=10)
+        max_scroll_spinbox.grid(row=4, column=1, padx=5, pady=2, sticky="w")
+        adaptive_cb = ttk.Checkbutton(input_frame, text="Adaptive Wait", variable=self.adaptive_wait_var)
+        adaptive_cb.grid(row=5, column=0, sticky="w", pady=2)
+        ttk.Label(input_frame, text="Max Wait (s):").grid(row=6, column=0, sticky="w", pady=2)
+        wait_timeout_spinbox = ttk.Spinbox(input_frame, from_=1.0, to_=60.0, increment=0.5, textvariable=self.wait_timeout_var, width=10, format="%.1f")
+        wait_timeout_spinbox.grid(row=6, column=1, padx=5, pady=2, sticky="w")
+        ttk.Label(input_frame, text="End After Checks:").grid(row=7, column=0, sticky="w", pady=2)
+        end_checks_spinbox = ttk.Spinbox(input_frame, from_=1, to_=20, increment=1, textvariable=self.end_checks_var, width=10)
+        end_checks_spinbox.grid(row=7, column=1, padx=5, pady=2, sticky="w")
+        ttk.Label(input_frame, text="Parallel Workers:").grid(row=8, column=0, sticky="w", pady=2)
+        workers_spinbox = ttk.Spinbox(input_frame, from_=1, to_=16, increment=1, textvariable=self.workers_var, width=10)
+        workers_spinbox.grid(row=8, column=1, padx=5, pady=2, sticky="w")
+        ttk.Label(input_frame, text="Max Log Lines:").grid(row=9, column=0, sticky="w", pady=2)
+        max_log_lines_spinbox = ttk.Spinbox(input_frame, from_=500, to_=100000, increment=500, textvariable=self.max_log_lines_var, width=10)
+        max_log_lines_spinbox.grid(row=9, column=1, padx=5, pady=2, sticky="w")
+        ttk.Label(input_frame, text="Delta Stop Batches:").grid(row=10, column=0, sticky="w", pady=2)
+        delta_stop_spinbox = ttk.Spinbox(input_frame, from_=1, to_=50, increment=1, textvariable=self.delta_stop_var, width=10)
+        delta_stop_spinbox.grid(row=10, column=1, padx=5, pady=2, sticky="w")
+        ttk.Label(input_frame, text="Enrich Browsers:").grid(row=11, column=0, sticky="w", pady=2)
+        enrich_workers_spinbox = ttk.Spinbox(input_frame, from_=1, to_=8, increment=1, textvariable=self.enrich_workers_var, width=10)
+        enrich_workers_spinbox.grid(row=11, column=1, padx=5, pady=2, sticky="w")
+        ttk.Label(input_frame, text="Enrich Req/s:").grid(row=12, column=0, sticky="w", pady=2)
+        enrich_rps_spinbox = ttk.Spinbox(input_frame, from_=0.1, to_=10.0, increment=0.1, textvariable=self.enrich_rps_var, width=10, format="%.1f")
+        enrich_rps_spinbox.grid(row=12, column=1, padx=5, pady=2, sticky="w")
+        ttk.Label(input_frame, text="Log File (optional):").grid(row=13, column=0, sticky="w", pady=2)
+        log_file_entry = ttk.Entry(input_frame, textvariable=self.log_file_var, width=50)
+        log_file_entry.grid(row=13, column=1, padx=5, pady=2, sticky="ew")
+        log_file_btn = ttk.Button(input_frame, text="Browse", command=self.browse_log_file)
+        log_file_btn.grid(row=13, column=2, pady=2)
+        ttk.Label(input_frame, text="Blacklist File(s):").grid(row=14, column=0, sticky="w", pady=2)
+        blacklist_entry = ttk.Entry(input_frame, textvariable=self.blacklist_path_var, width=50)
+        blacklist_entry.grid(row=14, column=1, padx=5, pady=2, sticky="ew")
+        blacklist_btn = ttk.Button(input_frame, text="Browse", command=self.browse_blacklist)
+        blacklist_btn.grid(row=14, column=2, pady=2)
+        ttk.Label(input_frame, text="Prometheus File (optional):").grid(row=15, column=0, sticky="w", pady=2)
+        prometheus_entry = ttk.Entry(input_frame, textvariable=self.prometheus_path_var, width=50)
+        prometheus_entry.grid(row=15, column=1, padx=5, pady=2, sticky="ew")
+        prometheus_btn = ttk.Button(input_frame, text="Browse", command=self.browse_prometheus)
+        prometheus_btn.grid(row=15, column=2, pady=2)
+        input_frame.columnconfigure(1, weight=1)
+        self.input_widgets.extend([cookies_entry, cookies_btn, output_entry, output_btn, headless_cb, verbose_cb, stream_cb, reuse_profile_cb, lean_cb, resume_cb, delta_cb, enrich_cb, snapshot_cb, export_jsonl_cb, export_sqlite_cb, scroll_delay_spinbox, max_scroll_spinbox, adaptive_cb, wait_timeout_spinbox, end_checks_spinbox, workers_spinbox, max_log_lines_spinbox, delta_stop_spinbox, enrich_workers_spinbox, enrich_rps_spinbox, log_file_entry, log_file_btn, blacklist_entry, blacklist_btn, prometheus_entry, prometheus_btn])
+        button_frame = ttk.Frame(self.master)
+        button_frame.pack(padx=10, pady=5, fill="x")
+        self.start_button = ttk.Button(button_frame, text="Start Scraping", command=self.start_scraping)
+        self.start_button.pack(side="left", padx=5)
+        self.stop_button = ttk.Button(button_frame, text="Stop Scraping", command=self.stop_scraping, state=tk.DISABLED)
+        self.stop_button.pack(side="left", padx=5)
+        self.status_label = ttk.Label(button_frame, text="Status: Ready", font=('Arial', 10, 'bold'))
+        self.status_label.pack(side="right", padx=5)
+        stats_frame = ttk.LabelFrame(self.master, text="Run Stats", padding="10")
+        stats_frame.pack(padx=10, pady=(5, 0), fill="x")
+        self.stats_label = ttk.Label(stats_frame, text="No run yet.", font=('Consolas', 9), justify="left", anchor="w")
+        self.stats_label.pack(fill="x")
+        log_frame = ttk.LabelFrame(self.master, text="Logs", padding="10")
+        log_frame.pack(padx=10, pady=10, fill="both", expand=True)
+        self.log_text = tk.Text(log_frame, wrap="word", height=20, bg="#212121", fg="#ffffff", font=('Consolas', 9), insertbackground="#ffffff")
+        self.log_text.pack(side="left", fill="both", expand=True)
+        log_scrollbar = ttk.Scrollbar(log_frame, command=self.log_text.yview)
+        log_scrollbar.pack(side="right", fill="y")
+        self.log_text.config(yscrollcommand=log_scrollbar.set)
+        self.log_text.tag_config("info", foreground="#00e676"); self.log_text.tag_config("verbose", foreground="#81d4fa"); self.log_text.tag_config("warning", foreground="#ffea00"); self.log_text.tag_config("error", foreground="#ff1744"); self.log_text.tag_config("stdout", foreground="#ffffff")
+    def browse_cookies(self):
+        # Pilih lebih dari satu file untuk scraping multi-akun (satu job per file cookies)
+        filenames = filedialog.askopenfilenames(title="Select Cookies File(s)", filetypes=[("JSON files", "*.json"), ("All files", "*.*")])
+        if filenames: self.cookies_path_var.set("; ".join(filenames))
+    def browse_output(self):
+        filename = filedialog.asksaveasfilename(title="Save Output As", defaultextension=".csv", filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if filename: self.output_path_var.set(filename)
+    def browse_log_file(self):
+        filename = filedialog.asksaveasfilename(title="Stream Full Log To", defaultextension=".log", filetypes=[("Log files", "*.log"), ("All files", "*.*")])
+        if filename: self.log_file_var.set(filename)
+    def browse_blacklist(self):
+        filenames = filedialog.askopenfilenames(title="Select Blacklist File(s)", filetypes=[("Blacklist files", "*.json *.txt"), ("All files", "*.*")])
+        if filenames: self.blacklist_path_var.set("; ".join(filenames))
+    def browse_prometheus(self):
+        filename = filedialog.asksaveasfilename(title="Write Prometheus Metrics To", defaultextension=".prom", filetypes=[("Prometheus textfile", "*.prom"), ("All files", "*.*")])
+        if filename: self.prometheus_path_var.set(filename)
+    def on_job_status(self, message, color="black", job=None):
+        # Untuk multi-akun, status keseluruhan diset oleh run_scraper setelah semua job selesai
+        if job is None or job.label is None: self.set_status(message, color)
+        if job is not None: self.stats_jobs[job] = job; self.update_stats()
+    def on_job_progress(self, job):
+        self.stats_jobs[job] = job; self.update_stats()
+        if job.label is not None:
+            self.set_status(f"Running ({len(jobs.active_jobs)} active) - {job.label}: {job.progress['phase']}, {job.progress['groups']} groups", "blue")
+    def update_stats(self):
+        self.stats_label.config(text="\n".join(format_stats(job.label or job.profile_name, job.metrics, job.status) for job in self.stats_jobs) or "No run yet.")
+    def set_status(self, message, color="black"):
+        self.status_label.config(text=f"Status: {message}", foreground=color); self.master.update_idletasks()
+    def toggle_input_widgets(self, state=tk.NORMAL):
+        for widget in self.input_widgets: widget.config(state=state)
+    def start_scraping(self):
+        from types import SimpleNamespace
+        export = [fmt for fmt, var in (("jsonl", self.export_jsonl_var), ("sqlite", self.export_sqlite_var)) if var.get()]
+        args = SimpleNamespace(cookies=self.cookies_path_var.get(), output=self.output_path_var.get(), headless=self.headless_var.get(), reuse_profile=self.reuse_profile_var.get(), verbose=self.verbose_var.get(), stream=self.stream_var.get(), lean=self.lean_var.get(), resume=self.resume_var.get(), delta=self.delta_var.get(), delta_stop=self.delta_stop_var.get(), known=None, enrich=self.enrich_var.get(), enrich_workers=self.enrich_workers_var.get(), enrich_rps=self.enrich_rps_var.get(), enrich_ttl=168, enrich_cache=None, snapshot='page' if self.snapshot_var.get() else None, snapshot_dir=None, scroll_delay=self.scroll_delay_var.get(), max_scroll=self.max_scroll_var.get(), adaptive_wait=self.adaptive_wait_var.get(), wait_timeout=self.wait_timeout_var.get(), end_checks=self.end_checks_var.get(), workers=self.workers_var.get(), encoding=self.encoding_var.get(), log_file=self.log_file_var.get().strip(), blacklist=self.blacklist_path_var.get().strip(), prometheus=self.prometheus_path_var.get().strip() or None, export=export)
+        if not all([args.cookies, args.output]): messagebox.showerror("Input Error", "Cookies and Output file paths cannot be empty."); return
+        self.log_pump.max_lines = self.max_log_lines_var.get()
+        self.stats_jobs = {}; self.update_stats()
+        self.set_status("Starting...", "blue"); self.start_button.config(state=tk.DISABLED); self.stop_button.config(state=tk.NORMAL); self.toggle_input_widgets(tk.DISABLED)
+        self.scraper_thread = threading.Thread(target=run_scraper, args=(args, self)); self.scraper_thread.daemon = True; self.scraper_thread.start(); self.check_scraper_thread()
+    def stop_scraping(self):
+        if messagebox.askyesno("Stop Scraping", "Are you sure? Data collected so far will be processed."):
+            self.set_status("Stopping...", "orange"); jobs.cancel_event.set(); self.stop_button.config(state=tk.DISABLED)
+    def reset_gui_state(self):
+        self.start_button.config(state=tk.NORMAL); self.stop_button.config(state=tk.DISABLED); self.toggle_input_widgets(tk.NORMAL)
+    def check_scraper_thread(self):
+        if self.scraper_thread.is_alive(): self.master.after(100, self.check_scraper_thread)
+        else: self.reset_gui_state()
+
+
+def main():
+    root = tk.Tk()
+    app = FacebookScraperApp(root)
+    root.mainloop()
@@ -0,0 +1,399 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+
+from .blacklist import build_blacklist, default_filter
+from .browser import (
+    ResourceMonitor, cached_profile_name, capture_page_html, create_driver, extract_group_names_and_urls, get_profile_name, iter_scroll_steps,
+    load_cookies, profile_dir_for, remember_profile_name, stream_group_names_and_urls, wait_for_groups_page,
+)
+from .processing import (
+    DEFAULT_BASE_URL, read_cookie_value, split_paths,
+)
+from .delta import DeltaTracker, diff_path, known_index_path, load_known_groups, write_diff, write_known_index
+from .enrich import ENRICH_CACHE_TTL, GroupMetaCache, enrich_groups
+from .metrics import Metrics, write_json_report, write_prometheus_textfile
+from .pipeline import run_pipeline
+from .replay import write_snapshot
+from .reporting import ConsoleReporter, PrefixedReporter
+from .store import GroupStore, iter_journal, partial_output_path
+
+# --- Shared Cancellation & Active Jobs ---
+# State per-akun (driver, data grup, progress) ada di ScrapeJob; yang global hanya sinyal stop bersama.
+cancel_event = threading.Event()
+active_jobs = []
+active_jobs_lock = threading.Lock()
+
+
+def cancel_all_jobs():
+    """Signals every running job to stop and quits their browsers."""
+    cancel_event.set()
+    with active_jobs_lock: jobs = list(active_jobs)
+    for job in jobs: job.close()
+
+
+# --- Scraping Job: state per-akun (driver, data grup, progress, output) ---
+class ScrapeJob(object):
+    """Scrapes the joined groups of one account (one cookies file) with its own WebDriver session."""
+    def __init__(self, args, cookies_path, reporter=None, label=None, cancel=cancel_event, output_path=None, blacklist=None):
+        self.args = args; self.cookies_path = cookies_path
+        self.label = label; self.log = PrefixedReporter(reporter or ConsoleReporter(args.verbose), label)
+        self.cancel = cancel
+        self.blacklist = blacklist or default_filter()
+        self.base_url = getattr(args, 'base_url', DEFAULT_BASE_URL).rstrip('/')
+        self.output_path = output_path  # None: diturunkan dari args.output + nama profil
+        self.driver = None
+        self.collected_group_data = {}  # {group_id: (name, canonical_url)}
+        self.profile_name = "user"
+        self.status = "Pending"
+        self.progress = {'phase': 'pending', 'groups': 0}
+        self.metrics = Metrics()  # span per fase, counter, histogram; dibaca panel statistik GUI & laporan run
+        self.monitor = None
+        self.store = None  # GroupStore: journal + checkpoint di samping output CSV
+        self.delta = None  # DeltaTracker saat args.delta: grup yang dikenal dari run sebelumnya
+        self.carried = {}  # grup dikenal yang tidak tercapai run delta ini: ikut output/index, tidak masuk journal
+        self.group_meta = None  # {group_id: meta} saat args.enrich; kolom tambahan di CSV
+        self.scroll_count = 0
+
+    def set_status(self, message, color="black"):
+        self.status = message
+        self.log.status(message, color, job=self)
+
+    @property
+    def timings(self):
+        """Seconds spent per phase so far."""
+        return self.metrics.span_totals()
+
+    def report_progress(self, phase=None):
+        if phase: self.progress['phase'] = phase
+        self.progress['groups'] = len(self.collected_group_data)
+        self.metrics.set('unique_groups', self.progress['groups'])
+        self.log.progress(self)
+
+    def timed(self, phase, func, *args, **kwargs):
+        with self.metrics.span(phase): return func(*args, **kwargs)
+
+    def resolve_profile_name(self):
+        """Uses the name cached for this account's c_user cookie, visiting /me/ only on a cache miss."""
+        user_id = read_cookie_value(self.cookies_path)
+        profile_name = cached_profile_name(user_id)
+        if profile_name:
+            self.log.verbose(f"Using cached profile name for c_user {user_id}: {profile_name}")
+            return profile_name
+        profile_name = get_profile_name(self.driver, self.log, self.base_url)
+        remember_profile_name(user_id, profile_name)
+        return profile_name
+
+    def on_scroll_step(self, scroll_count):
+        self.scroll_count = scroll_count
+        self.metrics.set('scrolls', scroll_count)
+        if self.monitor: self.monitor.sample()
+        self.store.checkpoint(scroll_count)
+        self.report_progress()
+
+    def open_store(self):
+        """Opens the job's journal; with args.resume the groups of the previous run are loaded back first."""
+        resume = self.args.resume
+        self.store = GroupStore(self.output_path)
+        recovered = self.store.open(resume=resume)
+        self.collected_group_data.update(recovered)
+        if resume:
+            previous = self.store.last_checkpoint
+            detail = f" (previous run: scroll {previous.get('scroll_count')}, status {previous.get('status')})" if previous else ""
+            self.log.info(f"Resuming: {len(recovered)} groups recovered from {self.store.journal_path.name}{detail}.")
+            self.report_progress()
+
+    def open_delta(self):
+        """Loads the groups known from the previous run: args.known, else this profile's index, else the last output CSV."""
+        args, log = self.args, self.log
+        candidates = [args.known, known_index_path(self.output_path, self.profile_name), self.output_path]
+        known, source = load_known_groups(candidates, args.encoding)
+        self.delta = DeltaTracker(known, args.delta_stop)
+        self.metrics.set('known_groups', len(known))
+        if source: log.info(f"Delta mode: {len(known)} known groups loaded from {source.name}; stopping after {self.delta.stop_after} batches with only known groups.")
+        else: log.info("Delta mode: no known groups from a previous run yet, scraping the full list.")
+
+    def finish_delta(self, interrupted):
+        """Returns (added, removed) against the known groups. When the list was not scrolled to the end, the known
+        groups this run did not reach are carried over into this run's outputs and known index (self.carried) and
+        removals cannot be told apart. They stay out of the journal, so a later --resume run still sees only the
+        groups it actually scrolled past and can report removals after a full scroll."""
+        delta, log = self.delta, self.log
+        added = delta.added(self.collected_group_data)
+        if delta.stopped_early or interrupted or self.scroll_count >= self.args.max_scroll:
+            removed = {}
+            self.carried = {group_id: group for group_id, group in delta.known.items() if group[0] and group_id not in self.store.group_ids}
+            log.info(f"Delta: carried over {len(self.carried)} known groups not reached by this run; removed groups are only reported after a full scroll.")
+        else:
+            removed = delta.removed(self.collected_group_data)
+        self.metrics.set('added_groups', len(added)); self.metrics.set('removed_groups', len(removed))
+        log.info(f"Delta: {len(added)} added, {len(removed)} removed.")
+        return added, removed
+
+    def save_delta(self, added, removed):
+        args, log = self.args, self.log
+        try:
+            path = diff_path(self.output_path, self.profile_name)
+            write_diff(path, added, removed, args.encoding)
+            write_known_index(known_index_path(self.output_path, self.profile_name), iter_job_records(self))
+            log.info(f"Delta diff saved to {path.name}.")
+        except OSError as e:
+            log.error(f"Could not save delta diff: {e}")
+
+    def save_snapshot(self):
+        """Archives the scrolled groups page (args.snapshot: 'page' or 'anchors') for browserless replay."""
+        args, log = self.args, self.log
+        directory = Path(args.snapshot_dir or Path(self.output_path).parent / "snapshots")
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path, n = directory / f"{self.profile_name}_{stamp}.html.gz", 2
+        while path.exists(): path = directory / f"{self.profile_name}_{stamp}_{n}.html.gz"; n += 1
+        meta = {'profile': self.profile_name, 'label': self.label, 'base_url': self.base_url, 'kind': args.snapshot,
+                'taken_at': time.time(), 'scrolls': self.scroll_count, 'groups': len(self.collected_group_data)}
+        try:
+            size = write_snapshot(path, capture_page_html(self.driver, args.snapshot), meta)
+            log.info(f"Page snapshot saved to {path} ({size / 2**20:.1f} MB).")
+        except (OSError, WebDriverException) as e:
+            log.error(f"Could not save page snapshot: {e}")
+
+    def enrich(self):
+        """Fetches member count, privacy and activity for every journaled or carried-over group. The job's own
+        (logged-in) driver is the first worker; args.enrich_workers - 1 extra lean drivers get this account's cookies."""
+        args, log = self.args, self.log
+        drivers = [self.driver]
+        try:
+            for _ in range(max(1, args.enrich_workers) - 1):
+                if self.cancel.is_set(): break
+                try: driver = create_driver(args.headless, None, lean=True)
+                except Exception as e:
+                    log.warning(f"Could not start an extra enrichment browser: {e}"); break
+                drivers.append(driver)
+                if not load_cookies(driver, self.cookies_path, log, self.base_url):
+                    drivers.pop().quit(); break
+            ttl_hours = args.enrich_ttl
+            with GroupMetaCache(args.enrich_cache, ENRICH_CACHE_TTL if ttl_hours is None else ttl_hours * 3600) as cache:
+                if cache.evicted: log.verbose(f"Enrichment cache: evicted {cache.evicted} expired entries.")
+                self.group_meta = enrich_groups(sorted(self.store.group_ids | self.carried.keys()), drivers, cache, log, self.base_url,
+                                                args.enrich_rps, self.cancel, self.metrics)
+        finally:
+            for driver in drivers[1:]:
+                try: driver.quit()
+                except WebDriverException: pass
+
+    def close(self):
+        if self.driver:
+            try: self.driver.quit()
+            except WebDriverException: pass
+            finally: self.driver = None
+
+    def run(self):
+        args, log = self.args, self.log
+        with active_jobs_lock: active_jobs.append(self)
+        try:
+            log.verbose("Initializing WebDriver...")
+            self.report_progress('starting')
+            profile_dir = profile_dir_for(self.cookies_path) if args.reuse_profile else None
+            try:
+                self.driver = self.timed('driver', create_driver, args.headless, profile_dir, args.lean, performance_log=True)
+                self.monitor = ResourceMonitor(self.driver)
+                log.verbose("WebDriver initialized.")
+            except Exception as e:
+                log.error(f"Failed to initialize WebDriver: {e}"); self.set_status("Error", "red"); return
+            if self.cancel.is_set(): self.set_status("Interrupted", "orange"); return
+            if not self.timed('cookies', load_cookies, self.driver, self.cookies_path, log, self.base_url):
+                log.error("Failed to login using cookies. Exiting."); self.set_status("Error", "red"); return
+            if self.cancel.is_set(): self.set_status("Interrupted", "orange"); return
+            # Nama profil diambil sebelum scroll agar nama file output sudah pasti saat data mulai ditulis
+            self.report_progress('profile')
+            self.profile_name = self.timed('profile', self.resolve_profile_name)
+            if self.output_path is None: self.output_path = job_output_path(args.output, self.profile_name)
+            self.open_store()
+            delta = args.delta
+            if delta: self.open_delta()
+            if self.cancel.is_set(): self.set_status("Interrupted", "orange"); return
+            self.timed('groups_page', self.driver.get, f"{self.base_url}/groups/joins/")
+            if self.cancel.is_set(): self.set_status("Interrupted", "orange"); return
+            try:
+                self.timed('groups_page_wait', wait_for_groups_page, self.driver, log)
+            except Exception as e:
+                log.error(f"Timed out waiting for groups page: {e}"); self.set_status("Error", "red"); return
+            log.info("Startup timings: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in self.timings.items()) + f" (total {sum(self.timings.values()):.2f}s)")
+            if self.cancel.is_set(): self.set_status("Interrupted", "orange"); return
+            self.report_progress('scrolling')
+            wait_options = dict(adaptive=args.adaptive_wait, wait_timeout=args.wait_timeout, end_checks=args.end_checks)
+            lean = args.lean
+            stream = args.stream
+            if delta and not stream:
+                log.warning("Delta mode needs Streaming Extraction to stop early; enabling it for this run."); stream = True
+            if lean and not stream: log.warning("Lean mode only collapses extracted cards with Streaming Extraction enabled.")
+            scroll_start = time.perf_counter()
+            if stream:
+                # Mode streaming: grup baru langsung masuk journal, jadi run yang terputus tetap punya datanya
+                for group_id, group_name, group_url in stream_group_names_and_urls(self.driver, self.collected_group_data, args.scroll_delay, args.max_scroll, log, self.base_url, self.cancel, prune=lean, on_step=self.on_scroll_step, metrics=self.metrics, stop_when=self.delta.end_batch if self.delta else None, blacklist=self.blacklist, **wait_options):
+                    # Grup yang hanya berganti nama (noise -> nama bersih) tidak dihitung ulang oleh delta
+                    if self.store.add(group_id, group_name, group_url) and self.delta: self.delta.observe(group_id)
+                    self.report_progress()
+            else:
+                for scroll_count in iter_scroll_steps(self.driver, args.scroll_delay, args.max_scroll, log, cancel=self.cancel, metrics=self.metrics, **wait_options):
+                    self.on_scroll_step(scroll_count)
+                if not self.cancel.is_set():
+                    self.report_progress('extracting')
+                    self.timed('extract', extract_group_names_and_urls, self.driver, self.collected_group_data, log, base_url=self.base_url, cancel=self.cancel, metrics=self.metrics, blacklist=self.blacklist)
+                    self.store.add_all(self.collected_group_data)
+
+            self.metrics.add_span('scroll', time.perf_counter() - scroll_start)
+            self.monitor.sample()
+            log.info(f"Browser resources: {self.monitor.summary()}")
+            self.report_progress('saving')
+            interrupted = self.cancel.is_set()
+            # Snapshot sebelum enrichment: driver utama setelah itu berpindah ke halaman grup
+            if args.snapshot and self.driver: self.timed('snapshot', self.save_snapshot)
+            if self.delta: added, removed = self.finish_delta(interrupted)
+            if args.enrich and not interrupted:
+                self.report_progress('enriching')
+                self.timed('enrich', self.enrich)
+            self.store.checkpoint(self.scroll_count, "interrupted" if interrupted else "completed", force=True)
+            # Semua output langsung dari journal dalam satu lintasan. Saat interrupted, output lengkap run
+            # sebelumnya tidak ditimpa: hasil sementara hanya ke '<stem>.partial.csv' (journal tetap jadi sumbernya)
+            exported = None
+            if not interrupted:
+                formats = ("csv", "txt", *(args.export or ()))
+                exported = self.timed('export', self.store.export, args.encoding, self.profile_name, log, formats, self.blacklist, self.group_meta,
+                                      extra=carried_records(self))
+            elif self.store.group_ids:
+                self.timed('export', self.store.export, args.encoding, self.profile_name, log, ("csv",), self.blacklist, self.group_meta,
+                           partial_output_path(self.output_path), carried_records(self))
+            else:
+                log.info("No groups collected; existing output left untouched.")
+            if exported:
+                for (kind, rule), count in exported[2].items(): self.metrics.incr('blacklisted', count, rule=f"{kind}:{rule}")
+                if self.delta: self.save_delta(added, removed)
+            log.verbose("Phase timings: " + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in self.timings.items()))
+            if not interrupted:
+                log.write("\n[INFO] Scraping and post-processing completed.\n", "info")
+                self.set_status("Completed", "green")
+            else:
+                log.write("\n[INFO] Scraping process interrupted. Continue later with Resume.\n", "info")
+                self.set_status("Interrupted", "orange")
+        except Exception as e:
+            log.write(f"\n[FATAL ERROR] An unexpected error occurred: {e}\n", "error")
+            self.set_status("Fatal Error", "red")
+            if self.store:
+                try: self.store.checkpoint(self.scroll_count, "failed", force=True)
+                except OSError: pass
+        finally:
+            self.report_progress('done')
+            if self.store: self.store.close()
+            self.close()
+            with active_jobs_lock:
+                if self in active_jobs: active_jobs.remove(self)
+
+
+_claimed_outputs = set()
+_claimed_outputs_lock = threading.Lock()
+
+def job_output_path(output, profile_name):
+    """Per-job CSV path '<stem>_<profile><suffix>', made unique when two jobs resolve the same profile name."""
+    output = Path(output)
+    with _claimed_outputs_lock:
+        candidate, n = output.with_name(f"{output.stem}_{profile_name}{output.suffix}"), 2
+        while str(candidate) in _claimed_outputs:
+            candidate = output.with_name(f"{output.stem}_{profile_name}_{n}{output.suffix}"); n += 1
+        _claimed_outputs.add(str(candidate))
+    return str(candidate)
+
+def carried_records(job):
+    """(group_id, name, url) records of the known groups a delta run carried over without journaling them."""
+    return ((group_id, name, url) for group_id, (name, url) in job.carried.items())
+
+def iter_job_records(job):
+    """(group_id, name, url) records of a finished job, streamed from its journal when it has one, plus the groups
+    a delta run carried over."""
+    if job.store is not None: return chain(iter_journal(job.store.journal_path), carried_records(job))
+    return ((group_id, name, url) for group_id, (name, url) in job.collected_group_data.items())
+
+def job_report(job):
+    """JSON-ready summary of one finished job for the run report."""
+    monitor = job.monitor
+    return {
+        'label': job.label, 'profile': job.profile_name, 'status': job.status, 'output': job.output_path,
+        'groups': len(job.collected_group_data), 'scrolls': job.scroll_count,
+        'resources': {'peak_rss_bytes': monitor.peak_rss, 'peak_js_heap_bytes': monitor.peak_js_heap,
+                      'bytes_received': monitor.bytes_received} if monitor else None,
+        'metrics': job.metrics.snapshot(),
+    }
+
+def write_run_reports(jobs, args, run_metrics, started, log, cancel=cancel_event):
+    """Writes '<output stem>.report.json' and, with args.prometheus, a Prometheus textfile for the whole run."""
+    output = Path(args.output)
+    report_path = output.with_name(f"{output.stem}.report.json")
+    status, _ = overall_status(jobs, cancel)
+    report = {
+        'started': time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(started)), 'wall_seconds': round(time.time() - started, 3),
+        'status': status, 'config': {k: v for k, v in vars(args).items() if not k.startswith('_')},
+        'jobs': [job_report(job) for job in jobs], 'run': run_metrics.snapshot(),
+    }
+    try:
+        write_json_report(report_path, report)
+        log.info(f"Run report saved to {report_path.name}.")
+        prometheus = args.prometheus
+        if prometheus:
+            by_job = {job.label or job.profile_name: job.metrics for job in jobs}
+            by_job['run'] = run_metrics
+            write_prometheus_textfile(prometheus, by_job)
+            log.verbose(f"Prometheus metrics written to {prometheus}.")
+    except OSError as e:
+        log.error(f"Could not write run report: {e}")
+
+def merge_job_results(jobs, args, log, blacklist=None, interrupted=False):
+    """Merges every job's groups (deduplicated by group ID) into '<stem>_merged' outputs and logs a per-job summary.
+    An interrupted run only writes '<stem>_merged.partial.csv', leaving the previous merged outputs in place.
+
+    The journals are streamed through the pipeline's external sort, so the merge does not hold all groups in memory.
+    """
+    log.write("\n==================== Jobs Summary ====================\n", "info")
+    for job in jobs:
+        log.write(f"{job.label:<20} {job.profile_name:<20} {job.status:<12} {len(job.collected_group_data)} groups\n", "info")
+    output = Path(args.output)
+    merged_path = output.with_name(f"{output.stem}_merged{output.suffix}")
+    formats = ("csv", "txt", *(args.export or ()))
+    if interrupted: merged_path, formats = partial_output_path(merged_path), ("csv",)
+    metadata = None
+    if any(job.group_meta is not None for job in jobs):
+        metadata = {}
+        for job in jobs: metadata.update(job.group_meta or {})
+    total, _, _ = run_pipeline(chain.from_iterable(iter_job_records(job) for job in jobs), merged_path, args.encoding,
+                               "merged", blacklist, formats, log, metadata=metadata)
+    log.write(f"Merged unique groups: {total}\n", "info")
+    log.write("======================================================\n\n", "info")
+    return total
+
+def run_scraping_jobs(args, reporter=None, cancel=cancel_event):
+    """Runs one ScrapeJob per cookies file on a pool of args.workers concurrent Chrome sessions."""
+    reporter = reporter or ConsoleReporter(args.verbose)
+    cancel.clear()  # Stop dari run sebelumnya tidak boleh membatalkan run ini
+    started, run_metrics = time.time(), Metrics()
+    cookie_paths = split_paths(args.cookies)
+    multi = len(cookie_paths) > 1
+    with _claimed_outputs_lock: _claimed_outputs.clear()
+    blacklist = build_blacklist(args)
+    jobs = [ScrapeJob(args, path, reporter, label=Path(path).stem if multi else None, cancel=cancel,
+                      output_path=None if multi else args.output, blacklist=blacklist)
+            for path in cookie_paths]
+    workers = max(1, min(int(args.workers), len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape-job") as pool:
+        list(pool.map(lambda job: job.run(), jobs))
+    if multi:
+        with run_metrics.span('merge'): merge_job_results(jobs, args, reporter, blacklist, cancel.is_set())
+    write_run_reports(jobs, args, run_metrics, started, reporter, cancel)
+    return jobs
+
+def overall_status(jobs, cancel=cancel_event):
+    """Summarises job statuses as (message, color) for the pool as a whole."""
+    statuses = [job.status for job in jobs]
+    if cancel.is_set(): return "Interrupted", "orange"
+    if statuses and all(st == "Completed" for st in statuses): return "Completed", "green"
+    return f"Completed with errors ({statuses.count('Completed')}/{len(jobs)} ok)", "orange"
@@ -0,0 +1,94 @@
+import logging
+import logging.handlers
+import queue
+
+from .reporting import Reporter
+
+# --- Log Pump: worker thread -> queue -> Tk main loop ---
+# Thread scraper tidak pernah menyentuh widget Tk; semua record masuk antrean dan
+# dikuras secara batch oleh after() di main loop (satu insert + satu scroll per batch).
+
+_LEVELS = {"error": logging.ERROR, "warning": logging.WARNING, "verbose": logging.DEBUG}
+
+
+def open_log_file(path, max_bytes=5 * 1024 * 1024, backups=3):
+    """Returns a logger writing to a size-rotated file (path, path.1 ... path.<backups>)."""
+    logger = logging.getLogger(f"fbscraper.logfile.{path}")
+    logger.setLevel(logging.DEBUG); logger.propagate = False
+    if not logger.handlers:
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+    return logger
+
+
+class QueueReporter(Reporter):
+    """Thread-safe Reporter: pushes structured records onto a queue drained by TkLogPump."""
+    def __init__(self, records, verbose=False, log_file=None):
+        super().__init__(verbose)
+        self.records = records
+        self.file_logger = open_log_file(log_file) if log_file else None
+
+    def write(self, text, tag="info"):
+        self.records.put(("log", text, tag))
+        if self.file_logger:
+            for line in text.splitlines():
+                if line.strip(): self.file_logger.log(_LEVELS.get(tag, logging.INFO), line)
+
+    def status(self, message, color="black", job=None):
+        self.records.put(("status", message, color, job))
+
+    def progress(self, job):
+        self.records.put(("progress", job))
+
+    def clear(self):
+        self.records.put(("clear",))
+
+
+class TkLogPump(object):
+    """Drains a record queue into a tk.Text widget on an after() tick, keeping at most max_lines lines."""
+    def __init__(self, widget, records, on_status=None, on_progress=None, max_lines=5000, interval_ms=100, max_batch=5000):
+        self.widget = widget; self.records = records
+        self.on_status = on_status; self.on_progress = on_progress
+        self.max_lines = max_lines; self.interval_ms = interval_ms; self.max_batch = max_batch
+        self._after_id = None
+
+    def start(self):
+        if self._after_id is None: self._after_id = self.widget.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        if self._after_id is not None: self.widget.after_cancel(self._after_id); self._after_id = None
+        self.drain()
+
+    def _tick(self):
+        self.drain()
+        self._after_id = self.widget.after(self.interval_ms, self._tick)
+
+    def drain(self):
+        chunks, status, progress = [], None, None
+        for _ in range(self.max_batch):
+            try: record = self.records.get_nowait()
+            except queue.Empty: break
+            kind = record[0]
+            if kind == "log":
+                _, text, tag = record
+                # Gabungkan teks berurutan dengan tag sama supaya insert tetap satu panggilan
+                if chunks and chunks[-1][1] == tag: chunks[-1][0] += text
+                else: chunks.append([text, tag])
+            elif kind == "clear":
+                chunks = []; self.widget.delete("1.0", "end")
+            elif kind == "status": status = record[1:]
+            elif kind == "progress": progress = record[1]
+        if chunks:
+            insert_args = []
+            for text, tag in chunks: insert_args.extend((text, (tag,)))
+            self.widget.insert("end", *insert_args)
+            self.trim()
+            self.widget.see("end")
+        if progress is not None and self.on_progress: self.on_progress(progress)
+        if status is not None and self.on_status: self.on_status(*status)
+
+    def trim(self):
+        lines = int(self.widget.index("end-1c").split(".")[0])
+        if self.max_lines and lines > self.max_lines:
+            self.widget.delete("1.0", f"{lines - self.max_lines + 1}.0")
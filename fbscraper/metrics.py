@@ -0,0 +1,157 @@
+import json
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Instrumentasi terstruktur per job: span (durasi fase), counter, dan histogram (waktu tunggu scroll, latensi
+# ekstraksi). Dibaca oleh panel statistik GUI, laporan JSON, dan textfile Prometheus (node_exporter).
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+MAX_SAMPLES = 10_000  # nilai mentah per histogram untuk persentil yang tepat
+
+
+class Histogram(object):
+    """Cumulative-bucket histogram (Prometheus style) that also keeps up to MAX_SAMPLES raw values."""
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0; self.sum = 0.0; self.max = 0.0
+        self.samples = []
+
+    def observe(self, value):
+        self.count += 1; self.sum += value; self.max = max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound: self.bucket_counts[i] += 1
+        if len(self.samples) < MAX_SAMPLES: self.samples.append(value)
+
+    def percentile(self, p):
+        if not self.samples: return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))]
+
+    def snapshot(self):
+        return {
+            'count': self.count, 'sum': round(self.sum, 4), 'max': round(self.max, 4),
+            'avg': round(self.sum / self.count, 4) if self.count else None,
+            'p50': self.percentile(50), 'p95': self.percentile(95),
+            'buckets': {str(bound): n for bound, n in zip(self.buckets, self.bucket_counts)},
+        }
+
+
+class Metrics(object):
+    """Thread-safe spans, counters and histograms for one job (or one whole run)."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans = {}        # name -> {'count', 'total', 'max'} (detik)
+        self.counters = {}     # (name, (('label', 'value'), ...)) -> nilai
+        self.histograms = {}   # name -> Histogram
+        self.gauges = set()    # nama counter yang diset (bukan dijumlah), diekspor sebagai gauge
+        self.started = time.time()
+
+    def add_span(self, name, seconds):
+        with self.lock:
+            span = self.spans.setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0})
+            span['count'] += 1; span['total'] += seconds; span['max'] = max(span['max'], seconds)
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try: yield
+        finally: self.add_span(name, time.perf_counter() - start)
+
+    def incr(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock: self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self.lock:
+            self.counters[(name, tuple(sorted(labels.items())))] = value; self.gauges.add(name)
+
+    def observe(self, name, value):
+        with self.lock:
+            if name not in self.histograms: self.histograms[name] = Histogram()
+            self.histograms[name].observe(value)
+
+    def counter(self, name, **labels):
+        with self.lock: return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def span_totals(self):
+        with self.lock: return {name: span['total'] for name, span in self.spans.items()}
+
+    def snapshot(self):
+        """Plain-dict copy used by the GUI panel and the JSON report."""
+        with self.lock:
+            counters = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                key = name + ("{" + ",".join(f"{k}={v}" for k, v in labels) + "}" if labels else "")
+                counters[key] = value
+            return {
+                'spans': {name: {'count': s['count'], 'total': round(s['total'], 4), 'max': round(s['max'], 4)} for name, s in self.spans.items()},
+                'counters': counters,
+                'histograms': {name: h.snapshot() for name, h in self.histograms.items()},
+            }
+
+
+def format_stats(label, metrics, status=None):
+    """Compact multi-line text for the GUI stats panel."""
+    snap = metrics.snapshot()
+    counters, spans, hists = snap['counters'], snap['spans'], snap['histograms']
+    blacklisted = sum(v for k, v in counters.items() if k.startswith('blacklisted'))
+    lines = [f"{label}{f' [{status}]' if status else ''}: groups {counters.get('unique_groups', 0)}, links seen {counters.get('links_seen', 0)}, "
+             f"duplicates {counters.get('duplicate_links', 0)}, scrolls {counters.get('scrolls', 0)}, blacklisted {blacklisted}"]
+    if spans: lines.append("  phases: " + ", ".join(f"{name} {s['total']:.1f}s" for name, s in spans.items()))
+    for name, title in (('scroll_wait_seconds', 'scroll wait'), ('extract_seconds', 'extract')):
+        h = hists.get(name)
+        if h and h['count']: lines.append(f"  {title}: n={h['count']} avg {h['avg']:.2f}s p50 {h['p50']:.2f}s p95 {h['p95']:.2f}s max {h['max']:.2f}s")
+    return "\n".join(lines)
+
+
+def write_json_report(path, report):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.write_text(json.dumps(report, indent=2, ensure_ascii=False, default=str), encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+def _prom_name(name):
+    return "fbscraper_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+def _prom_labels(labels):
+    if not labels: return ""
+    escaped = (str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, v in labels)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(labels, escaped)) + "}"
+
+def write_prometheus_textfile(path, metrics_by_job):
+    """Writes every job's metrics in Prometheus text format, atomically (for node_exporter's textfile collector)."""
+    families = {}  # nama metrik -> (tipe, help, baris); format teks mewajibkan satu blok per metrik
+    def family(name, kind, help_text):
+        return families.setdefault(name, (kind, help_text, []))[2]
+    for job, metrics in metrics_by_job.items():
+        account_label = (("account", job),)  # bukan "job": label itu milik target Prometheus
+        with metrics.lock:
+            for phase, span in metrics.spans.items():
+                lines = family(_prom_name("phase_seconds_total"), "counter", "Wall time spent per scraper phase.")
+                lines.append(f"{_prom_name('phase_seconds_total')}{_prom_labels(account_label + (('phase', phase),))} {span['total']:.6f}")
+            for (counter, labels), value in sorted(metrics.counters.items()):
+                gauge = counter in metrics.gauges
+                name = _prom_name(counter if gauge else f"{counter}_total")
+                family(name, "gauge" if gauge else "counter", f"Scraper {'gauge' if gauge else 'counter'} {counter}.").append(
+                    f"{name}{_prom_labels(account_label + labels)} {value}")
+            for hist_name, hist in metrics.histograms.items():
+                name = _prom_name(hist_name)
+                lines = family(name, "histogram", f"Scraper histogram {hist_name}.")
+                for bound, count in zip(hist.buckets, hist.bucket_counts):
+                    lines.append(f"{name}_bucket{_prom_labels(account_label + (('le', repr(float(bound))),))} {count}")
+                lines.append(f"{name}_bucket{_prom_labels(account_label + (('le', '+Inf'),))} {hist.count}")
+                lines.append(f"{name}_sum{_prom_labels(account_label)} {hist.sum:.6f}")
+                lines.append(f"{name}_count{_prom_labels(account_label)} {hist.count}")
+    lines = []
+    for name, (kind, help_text, samples) in families.items():
+        lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples])
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(f"{path}.tmp")
+    tmp_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    os.replace(tmp_path, path)
@@ -0,0 +1,147 @@
+import csv
+import heapq
+import json
+import pickle
+import sqlite3
+import tempfile
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+
+from .blacklist import default_filter
+from .processing import prefer_group_name
+
+# Post-processing satu lintasan: record (group_id, name, url) -> dedup per group_id -> urut nama ->
+# CSV + TXT filtered (+ JSONL/SQLite) ditulis bersamaan. Memori dibatasi lewat external merge sort.
+EXPORT_FORMATS = ("jsonl", "sqlite")
+SORT_CHUNK_ROWS = 200_000  # baris per run yang diurutkan di memori sebelum ditumpahkan ke file sementara
+SPILL_BATCH_ROWS = 5000  # baris per blok pickle di file run
+SQLITE_BATCH_ROWS = 5000
+META_FIELDS = ('members', 'privacy', 'activity')  # metadata enrichment (fbscraper.enrich)
+META_COLUMNS = ('Members', 'Privacy', 'Activity')
+
+
+def _spill(rows, stack, tmp_dir):
+    # File run bersifat privat dan sementara, jadi pickle per blok (jauh lebih cepat dari JSON per baris)
+    run = stack.enter_context(tempfile.TemporaryFile(dir=tmp_dir))
+    for i in range(0, len(rows), SPILL_BATCH_ROWS): pickle.dump(rows[i:i + SPILL_BATCH_ROWS], run, pickle.HIGHEST_PROTOCOL)
+    run.seek(0)
+    return run
+
+def _read_run(run):
+    while True:
+        try: yield from pickle.load(run)
+        except EOFError: return
+
+def external_sort(rows, key, chunk_rows=SORT_CHUNK_ROWS, tmp_dir=None):
+    """Yields rows (tuples of picklable values) ordered by key, stable like sorted().
+
+    Inputs larger than chunk_rows are split into sorted runs on temp files and merged with heapq.merge,
+    so memory stays at about one chunk regardless of input size.
+    """
+    with ExitStack() as stack:
+        runs, chunk = [], []
+        for row in rows:
+            chunk.append(tuple(row))
+            if len(chunk) >= chunk_rows:
+                chunk.sort(key=key); runs.append(_spill(chunk, stack, tmp_dir)); chunk = []
+        chunk.sort(key=key)
+        if not runs:
+            yield from chunk
+            return
+        # heapq.merge mendahulukan iterable yang lebih awal saat key sama, jadi urutan input tetap terjaga
+        yield from heapq.merge(*[_read_run(run) for run in runs], chunk, key=key)
+
+def dedupe_by_id(records, chunk_rows=SORT_CHUNK_ROWS, tmp_dir=None, blacklist=None):
+    """Keeps one (group_id, name, url) record per group_id: the first one seen, unless its name is blacklisted and a
+    later record's is not (see processing.prefer_group_name). Output is ordered by group_id."""
+    current = None
+    for record in external_sort(records, key=lambda r: r[0], chunk_rows=chunk_rows, tmp_dir=tmp_dir):
+        if current is None or record[0] != current[0]:
+            if current is not None: yield current
+            current = record
+        elif prefer_group_name(current[1], record[1], blacklist):
+            current = record
+    if current is not None: yield current
+
+
+def output_paths(output_path, profile_name="user"):
+    """All files a pipeline run can write, keyed by output kind."""
+    output = Path(output_path)
+    return {
+        'csv': output,
+        'names': output.with_name(f"{output.stem}_names_filtered_{profile_name}.txt"),
+        'urls': output.with_name(f"{output.stem}_urls_filtered_{profile_name}.txt"),
+        'jsonl': output.with_name(f"{output.stem}.jsonl"),
+        'sqlite': output.with_name(f"{output.stem}.sqlite"),
+    }
+
+def meta_row(meta):
+    """CSV cells for META_COLUMNS ('' for unknown values)."""
+    meta = meta or {}
+    return ['' if meta.get(key) is None else meta[key] for key in META_FIELDS]
+
+def _open_sqlite(path):
+    db = sqlite3.connect(str(path))
+    db.execute("DROP TABLE IF EXISTS groups")
+    db.execute("CREATE TABLE groups (group_id TEXT PRIMARY KEY, name TEXT NOT NULL, url TEXT NOT NULL, blacklisted_by TEXT, "
+               "members INTEGER, privacy TEXT, activity TEXT)")
+    return db
+
+def run_pipeline(records, output_path, encoding, profile_name="user", blacklist=None, formats=("csv", "txt"), log=None,
+                 chunk_rows=SORT_CHUNK_ROWS, metadata=None):
+    """Dedupes (group_id, name, url) records by group_id, sorts them by name and writes every requested format in
+    one pass: 'csv' (all groups), 'txt' (filtered names/urls), 'jsonl' and 'sqlite' (all groups + blacklist rule).
+
+    metadata ({group_id: meta} from enrich.enrich_groups) adds the Members/Privacy/Activity columns.
+    Returns (total, kept, hits) where hits counts blacklisted groups per (kind, rule).
+    """
+    blacklist = blacklist or default_filter()
+    paths = output_paths(output_path, profile_name)
+    total = kept = 0; hits = Counter()
+    with ExitStack() as stack:
+        paths['csv'].parent.mkdir(parents=True, exist_ok=True)
+        csv_writer = names_file = urls_file = jsonl_file = db = None
+        if 'csv' in formats:
+            csv_writer = csv.writer(stack.enter_context(open(paths['csv'], 'w', newline='', encoding=encoding)))
+            csv_writer.writerow(['GroupName', 'GroupURL', *(META_COLUMNS if metadata is not None else ())])
+        if 'txt' in formats:
+            names_file = stack.enter_context(open(paths['names'], 'w', encoding=encoding))
+            urls_file = stack.enter_context(open(paths['urls'], 'w', encoding=encoding))
+        if 'jsonl' in formats:
+            jsonl_file = stack.enter_context(open(paths['jsonl'], 'w', encoding='utf-8'))
+        if 'sqlite' in formats:
+            db = _open_sqlite(paths['sqlite']); stack.callback(db.close)
+        sqlite_rows = []
+        tmp_dir = str(paths['csv'].parent)
+        unique = dedupe_by_id(records, chunk_rows, tmp_dir, blacklist)
+        for group_id, name, url in external_sort(unique, key=lambda r: (r[1], r[0]), chunk_rows=chunk_rows, tmp_dir=tmp_dir):
+            total += 1
+            hit = blacklist.match(name)
+            if hit: hits[hit] += 1
+            else:
+                kept += 1
+                if names_file: names_file.write(name + '\n'); urls_file.write(url + '\n')
+            meta = metadata.get(group_id) if metadata is not None else None
+            if csv_writer: csv_writer.writerow([name, url, *meta_row(meta)] if metadata is not None else [name, url])
+            rule = f"{hit.kind}:{hit.rule}" if hit else None
+            if jsonl_file:
+                record = {'id': group_id, 'name': name, 'url': url, 'blacklisted_by': rule}
+                if meta: record.update(meta)
+                jsonl_file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            if db is not None:
+                meta = meta or {}
+                sqlite_rows.append((group_id, name, url, rule, *(meta.get(key) for key in META_FIELDS)))
+                if len(sqlite_rows) >= SQLITE_BATCH_ROWS:
+                    db.executemany("INSERT INTO groups VALUES (?, ?, ?, ?, ?, ?, ?)", sqlite_rows); sqlite_rows = []
+        if db is not None:
+            db.executemany("INSERT INTO groups VALUES (?, ?, ?, ?, ?, ?, ?)", sqlite_rows)
+            db.commit()
+
+    if log:
+        written = [paths[kind].name for kind in ('csv', 'jsonl', 'sqlite') if kind in formats]
+        if written: log.info(f"Saved {total} unique groups to {', '.join(written)}.")
+        if 'txt' in formats:
+            log.info(f"Found {kept} groups after filtering; saved to {paths['names'].name} and {paths['urls'].name}.")
+            for (kind, rule), count in hits.most_common(10): log.verbose(f"Blacklisted by {kind} '{rule}': {count}")
+    return total, kept, hits
@@ -0,0 +1,134 @@
+import csv
+import json
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+# Modul ini sengaja tidak mengimpor Selenium/Tk: dipakai oleh CLI (validasi), GUI dan post-processing.
+DEFAULT_BASE_URL = "https://www.facebook.com"
+
+# Definisi "link grup" yang dipakai semua jalur ekstraksi
+GROUP_LINKS_XPATH = "//a[contains(@href, '/groups/') and @role='link' and normalize-space(.)]"
+
+# Segmen setelah /groups/ yang merupakan halaman navigasi Facebook, bukan ID grup
+GROUP_NAV_SEGMENTS = {"joins", "feed", "discover", "create", "notifications", "search", "browse", "categories"}
+
+# --- Blacklist Definitions ---
+blacklist_keywords = [
+    "berita hari ini", "berita terkini", "berita trending hari ini", "beranda anda",
+    "berita viral", "temukan", "discover", "view group", "your feed", "your groups",
+    "see all", "create new group", "buat grup baru", "lihat grup", "lihat semua"
+]
+
+# --- PERBAIKAN FILTER UTAMA: Pola Regex yang Lebih Akurat ---
+blacklist_patterns = [
+    # Pola untuk "BERITA [NAMA NEGARA/KOTA] [TAHUN]"
+    r"berita\s+([a-zA-Z\s]+)\s+\d{4}",
+
+    # Pola Bahasa Indonesia yang Diperbaiki (lebih akurat)
+    # Menangkap format: [angka] [unit waktu] atau [se-unitwaktu]
+    r"(terakhir aktif|active)\s+(?:sekitar|about)?\s*(\d+\s+(?:detik|menit|jam|hari|minggu)|semenit|sejam|sehari|seminggu)\s+(?:yang )?lalu",
+
+    # Pola Bahasa Inggris yang sudah diperbaiki
+    r"(last active|active)\s+(?:about|a few)?\s*(\d+|a|an)\s+(second|minute|hour|day|week)s?\s+ago",
+
+    # Pola umum untuk menangkap sisa-sisa yang mungkin terlewat
+    r"last active a few seconds ago", r"last active about a minute ago"
+]
+
+
+def split_paths(value):
+    """Accepts a list of paths or a ';'-separated string (as built by the GUI) and returns the paths."""
+    if isinstance(value, (list, tuple)): return [str(v) for v in value if str(v).strip()]
+    return [p.strip() for p in str(value).split(';') if p.strip()]
+
+def read_cookie_value(cookies_path, name="c_user"):
+    """Returns the value of one cookie from an exported cookies JSON file, or None."""
+    try:
+        with open(cookies_path, 'r', encoding='utf-8') as f:
+            cookies = json.load(f)
+        return next((str(c.get('value')) for c in cookies if isinstance(c, dict) and c.get('name') == name), None)
+    except (OSError, ValueError, TypeError):
+        return None
+
+def contains_blacklist(text):
+    # Engine terkompilasi (fbscraper.blacklist); hasilnya identik dengan cek keyword + regex satu per satu
+    from .blacklist import default_filter
+    return default_filter().contains(text)
+
+def canonical_group_id(url):
+    """The group ID (numeric ID or lowercased vanity slug) from any /groups/<id>/... href, or None.
+
+    '/groups/123/', '/groups/123/?ref=share' and '/groups/123/permalink/9/' all give '123'. A numeric ID and the
+    vanity slug of the same group cannot be matched without visiting the page, so they stay separate.
+    """
+    parts = [p for p in urlsplit(url or '').path.split('/') if p]
+    try: index = parts.index('groups')
+    except ValueError: return None
+    if index + 1 >= len(parts): return None
+    group_id = unquote(parts[index + 1]).strip().lower()
+    return None if not group_id or group_id in GROUP_NAV_SEGMENTS else group_id
+
+def canonical_group_url(group_id, base_url=DEFAULT_BASE_URL):
+    return f"{base_url}/groups/{group_id}/"
+
+def iter_normalized_group_links(pairs, base_url=DEFAULT_BASE_URL):
+    """Cleans raw (name, href) pairs into (group_id, name, canonical_url), dropping links that are not a group."""
+    for group_name, group_url in pairs:
+        group_name = (group_name or '').strip()
+        group_id = canonical_group_id(group_url) if group_name else None
+        if group_id: yield group_id, group_name, canonical_group_url(group_id, base_url)
+
+def prefer_group_name(current, candidate, blacklist=None):
+    """True when candidate should replace current as a group's name: current is blacklisted noise (e.g. a sidebar
+    link reading 'Name\nLast active 5 minutes ago') and candidate is not. blacklist defaults to the built-in filter."""
+    if candidate == current: return False
+    contains = blacklist.contains if blacklist is not None else contains_blacklist
+    return contains(current) and not contains(candidate)
+
+def add_group_record(group_data, group_id, group_name, group_url, blacklist=None):
+    """Stores one group in group_data ({group_id: (name, url)}). A known group only takes the new name when it
+    replaces blacklisted noise (see prefer_group_name). Returns True when group_data changed."""
+    current = group_data.get(group_id)
+    if current is not None and not prefer_group_name(current[0], group_name, blacklist): return False
+    group_data[group_id] = (group_name, group_url)
+    return True
+
+def normalize_group_links(pairs, group_data, base_url=DEFAULT_BASE_URL, blacklist=None):
+    """Adds groups from raw (name, href) pairs to group_data ({group_id: (name, url)}). Returns number added."""
+    added = 0
+    for group_id, group_name, group_url in iter_normalized_group_links(pairs, base_url):
+        added += group_id not in group_data
+        add_group_record(group_data, group_id, group_name, group_url, blacklist)
+    return added
+
+def save_groups_to_file(output_path, group_data, encoding, log=None):
+    """Writes group_data ({group_id: (name, url)}) to a CSV sorted by name (pipeline.run_pipeline, CSV only)."""
+    if not group_data: return
+    from .pipeline import run_pipeline  # pipeline mengimpor modul ini
+    try:
+        run_pipeline(((group_id, name, url) for group_id, (name, url) in group_data.items()), output_path, encoding, formats=("csv",), log=log)
+    except Exception as e:
+        if log: log.error(f"Could not write to CSV file: {e}")
+
+
+def iter_csv_records(csv_input_path, encoding):
+    """Yields (group_id, name, url) from an output CSV; rows whose URL has no group ID are keyed by the URL itself."""
+    with open(csv_input_path, mode='r', encoding=encoding, errors='ignore') as csvfile:
+        for row in csv.DictReader(csvfile):
+            name, url = (row.get('GroupName') or '').strip(), (row.get('GroupURL') or '').strip()
+            if name and url: yield canonical_group_id(url) or url, name, url
+
+# --- FUNGSI DIMODIFIKASI: post_process_csv sekarang menerima profile_name ---
+def post_process_csv(csv_input_path, log, encoding, profile_name="user", blacklist=None, formats=("txt",)):
+    """Writes the filtered TXT files (and any extra formats) for an existing CSV via the single-pass pipeline."""
+    from .pipeline import run_pipeline
+    log.info("Starting post-processing to filter and separate data...")
+    if not Path(csv_input_path).exists():
+        log.error("CSV input file not found for post-processing.")
+        return
+    try:
+        run_pipeline(iter_csv_records(csv_input_path, encoding), csv_input_path, encoding, profile_name, blacklist,
+                     formats=[f for f in formats if f != 'csv'], log=log)
+        log.info("Post-processing completed.")
+    except Exception as e:
+        log.error(f"An error occurred during post-processing: {e}")
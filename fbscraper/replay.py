@@ -0,0 +1,158 @@
+import gzip
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from html import unescape
+from pathlib import Path
+
+from .processing import DEFAULT_BASE_URL, GROUP_LINKS_XPATH, iter_normalized_group_links
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# Arsip snapshot halaman (gzip) + replay tanpa browser: HTML hasil scroll disimpan sekali, lalu ekstraksi,
+# blacklist, dan pipeline output bisa dijalankan ulang kapan saja (mis. setelah blacklist/XPath berubah).
+# Baris pertama snapshot adalah komentar HTML berisi metadata JSON (profil, base URL, waktu ambil).
+SNAPSHOT_MARKER = "fbscraper-snapshot"
+SNAPSHOT_SUFFIXES = (".html.gz", ".html")
+GROUP_LINKS_CSS = "a[href*='/groups/'][role='link']"  # padanan CSS untuk GROUP_LINKS_XPATH
+REPLAY_CHUNKSIZE = 4  # snapshot per tugas worker
+
+
+def write_snapshot(path, html, meta):
+    """Writes a gzip snapshot with a metadata header line, atomically. Returns the compressed size in bytes."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = json.dumps(meta, ensure_ascii=False).replace("-->", "--\\u003e")
+    tmp_path = Path(f"{path}.tmp")
+    with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+        f.write(f"<!-- {SNAPSHOT_MARKER} {header} -->\n"); f.write(html)
+    os.replace(tmp_path, path)
+    return path.stat().st_size
+
+def read_snapshot(path):
+    """Returns (meta, html) of a snapshot; plain .html files without a header give empty metadata."""
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8', errors='replace') as f:
+        first = f.readline()
+        rest = f.read()
+    prefix = f"<!-- {SNAPSHOT_MARKER} "
+    if first.startswith(prefix):
+        try: return json.loads(first[len(prefix):].rsplit("-->", 1)[0]), rest
+        except ValueError: pass
+    return {}, first + rest
+
+def iter_snapshot_paths(paths):
+    """Snapshot files from a mix of file and directory paths (directories are searched recursively)."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob("*") if p.is_file() and p.name.endswith(SNAPSHOT_SUFFIXES))
+        elif path.is_file():
+            yield path
+
+
+def _link_text(text):
+    # Mendekati innerText untuk konten inline: spasi beruntun dirapatkan
+    return " ".join((text or "").split())
+
+# Fallback stdlib: regex hanya mencari elemen <a> (atribut ber-kutip boleh berisi '>'), tanpa membangun DOM
+ANCHOR_RE = re.compile(r"""<a\b((?:[^>"']|"[^"]*"|'[^']*')*)>(.*?)</a\s*>""", re.IGNORECASE | re.DOTALL)
+ATTR_RE = re.compile(r"""([^\s=/>"']+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+)))?""")
+TAG_RE = re.compile(r"<[^>]*>")
+
+def _stdlib_group_links(html):
+    """Stdlib equivalent of GROUP_LINKS_XPATH: <a role="link"> whose href contains '/groups/' and that has text."""
+    pairs = []
+    for match in ANCHOR_RE.finditer(html):
+        if '/groups/' not in match.group(1): continue
+        attrs = {name.lower(): unescape(next((v for v in values if v is not None), '')) for name, *values in ATTR_RE.findall(match.group(1))}
+        href = attrs.get('href') or ''
+        if attrs.get('role') != 'link' or '/groups/' not in href: continue
+        name = _link_text(unescape(TAG_RE.sub('', match.group(2))))
+        if name: pairs.append((name, href))
+    return pairs
+
+def available_parser(xpath=GROUP_LINKS_XPATH):
+    """Fastest installed parser that can evaluate xpath: selectolax, lxml, or a stdlib regex scanner."""
+    if xpath != GROUP_LINKS_XPATH:
+        if lxml_html is None: raise RuntimeError("A custom link XPath needs lxml (pip install lxml).")
+        return 'lxml'
+    if SelectolaxParser is not None: return 'selectolax'
+    return 'lxml' if lxml_html is not None else 'stdlib'
+
+def extract_snapshot_links(html, xpath=GROUP_LINKS_XPATH, parser=None):
+    """(name, href) pairs for the group links of a snapshot, like fetch_group_links_batched does in the browser."""
+    parser = parser or available_parser(xpath)
+    if not html.strip(): return []
+    if parser == 'selectolax':
+        pairs = ((_link_text(node.text()), node.attributes.get('href') or '') for node in SelectolaxParser(html).css(GROUP_LINKS_CSS))
+    elif parser == 'lxml':
+        pairs = ((_link_text(el.text_content()), el.get('href') or '') for el in lxml_html.fromstring(html).xpath(xpath))
+    else:
+        return _stdlib_group_links(html)
+    return [(name, href) for name, href in pairs if name]
+
+def parse_snapshot(path, xpath=GROUP_LINKS_XPATH, base_url=None):
+    """Worker: returns (path, meta, links_seen, [(group_id, name, url), ...]) for one snapshot file."""
+    meta, html = read_snapshot(path)
+    pairs = extract_snapshot_links(html, xpath)
+    # Dedup per snapshot di worker: link duplikat persis (?ref=, permalink) tidak perlu dikirim balik ke proses utama.
+    # Nama berbeda untuk ID yang sama tetap dikirim; pipeline memilih nama yang lolos blacklist run ini.
+    records = {}
+    for record in iter_normalized_group_links(pairs, (base_url or meta.get('base_url') or DEFAULT_BASE_URL).rstrip('/')):
+        records.setdefault(record[:2], record)
+    return str(path), meta, len(pairs), list(records.values())
+
+
+def replay_snapshots(paths, output_path, encoding, log, blacklist=None, formats=("csv", "txt"), xpath=GROUP_LINKS_XPATH,
+                     base_url=None, processes=None):
+    """Re-extracts groups from archived snapshots without a browser and writes the usual outputs per profile.
+
+    Snapshots are parsed on a process pool. Per profile, newer snapshots come first, so a group keeps its most
+    recent name. Several profiles get '<stem>_<profile>' outputs plus a '<stem>_merged' one, as a multi-account
+    scrape does. Returns {profile: (total, kept, hits)}.
+    """
+    from .pipeline import run_pipeline
+    files = list(iter_snapshot_paths(paths))
+    if not files:
+        log.error("No snapshots found to replay."); return {}
+    parser = available_parser(xpath)
+    workers = max(1, min(processes or os.cpu_count() or 1, len(files)))
+    log.info(f"Replaying {len(files)} snapshot(s) with {parser} on {workers} process(es)...")
+    start = time.perf_counter()
+    args = ([str(f) for f in files], [xpath] * len(files), [base_url] * len(files))
+    if workers == 1:
+        results = list(map(parse_snapshot, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool: results = list(pool.map(parse_snapshot, *args, chunksize=REPLAY_CHUNKSIZE))
+    by_profile, links = defaultdict(list), 0
+    for path, meta, seen, records in results:
+        links += seen
+        by_profile[meta.get('profile') or 'user'].append((meta.get('taken_at') or 0, path, records))
+    log.info(f"Parsed {len(files)} snapshot(s), {links} group links, in {time.perf_counter() - start:.2f}s.")
+
+    def profile_records(snapshots):
+        for _, _, records in sorted(snapshots, key=lambda s: (-s[0], s[1])): yield from records
+
+    output = Path(output_path)
+    summary = {}
+    for profile, snapshots in sorted(by_profile.items()):
+        path = output if len(by_profile) == 1 else output.with_name(f"{output.stem}_{profile}{output.suffix}")
+        log.info(f"Profile {profile}: {len(snapshots)} snapshot(s) -> {path.name}")
+        summary[profile] = run_pipeline(profile_records(snapshots), path, encoding, profile, blacklist, formats, log)
+    if len(by_profile) > 1:
+        merged = output.with_name(f"{output.stem}_merged{output.suffix}")
+        everything = (record for snapshots in by_profile.values() for record in profile_records(snapshots))
+        summary['merged'] = run_pipeline(everything, merged, encoding, "merged", blacklist, formats, log)
+    log.info(f"Replay finished in {time.perf_counter() - start:.2f}s.")
+    return summary
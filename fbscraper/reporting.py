@@ -0,0 +1,96 @@
+import sys
+
+from .processing import split_paths
+
+
+# --- Logging / Progress Callback Interface ---
+# Core scraper tidak tahu apa-apa tentang Tk: semua log, status dan progress lewat Reporter.
+class Reporter(object):
+    """Sink for scraper output. Subclasses override write(); status() and progress() are optional hooks."""
+    def __init__(self, verbose=False):
+        self.verbose_enabled = verbose
+
+    def write(self, text, tag="info"):
+        raise NotImplementedError
+
+    def verbose(self, message):
+        if self.verbose_enabled: self.write(f"[VERBOSE] {message}\n", "verbose")
+
+    def info(self, message): self.write(f"[INFO] {message}\n", "info")
+    def warning(self, message): self.write(f"[WARNING] {message}\n", "warning")
+    def error(self, message): self.write(f"[ERROR] {message}\n", "error")
+
+    def status(self, message, color="black", job=None):
+        pass
+
+    def progress(self, job):
+        pass
+
+
+class ConsoleReporter(Reporter):
+    """Writes to stdout (errors and warnings to stderr)."""
+    def write(self, text, tag="info"):
+        stream = sys.stderr if tag in ("error", "warning") else sys.stdout
+        stream.write(text); stream.flush()
+
+    def status(self, message, color="black", job=None):
+        label = f"{job.label}: " if job is not None and job.label else ""
+        sys.stderr.write(f"[STATUS] {label}{message}\n")
+
+
+class CallbackReporter(Reporter):
+    """Adapts plain callables: on_log(text, tag), on_status(message, color, job), on_progress(job)."""
+    def __init__(self, on_log, on_status=None, on_progress=None, verbose=False):
+        super().__init__(verbose)
+        self.on_log = on_log; self.on_status = on_status; self.on_progress = on_progress
+
+    def write(self, text, tag="info"):
+        self.on_log(text, tag)
+
+    def status(self, message, color="black", job=None):
+        if self.on_status: self.on_status(message, color, job)
+
+    def progress(self, job):
+        if self.on_progress: self.on_progress(job)
+
+
+class PrefixedReporter(Reporter):
+    """Prefixes each non-empty line with a job label and forwards everything to a parent reporter."""
+    def __init__(self, parent, label=None):
+        super().__init__(parent.verbose_enabled)
+        self.parent = parent; self.label = label
+
+    def write(self, text, tag="info"):
+        if self.label:
+            text = "".join(f"[{self.label}] {line.lstrip()}" if line.strip() else line for line in text.splitlines(True))
+        self.parent.write(text, tag)
+
+    def status(self, message, color="black", job=None):
+        self.parent.status(message, color, job)
+
+    def progress(self, job):
+        self.parent.progress(job)
+
+
+def log_config_summary(args, log):
+    log.write("\n================ Configuration Summary ================\n", "info")
+    log.write(f"Cookies File(s)   : {'; '.join(split_paths(args.cookies))}\n", "info")
+    log.write(f"Parallel Workers  : {args.workers}\n", "info")
+    log.write(f"Output File       : {args.output} (Format: CSV)\n", "info")
+    log.write(f"Headless Mode     : {'ON' if args.headless else 'OFF'}\n", "info")
+    log.write(f"Reuse Profile     : {'ON' if args.reuse_profile else 'OFF'}\n", "info")
+    log.write(f"Verbose Logging   : {'ON' if args.verbose else 'OFF'}\n", "info")
+    log.write(f"Scroll Delay      : {args.scroll_delay}s\n", "info")
+    log.write(f"Max Scroll        : {args.max_scroll}\n", "info")
+    log.write(f"Adaptive Wait     : {f'ON (timeout {args.wait_timeout}s, end after {args.end_checks} checks)' if args.adaptive_wait else 'OFF'}\n", "info")
+    log.write(f"Streaming Extract : {'ON' if args.stream else 'OFF'}\n", "info")
+    log.write(f"Lean Mode         : {'ON' if args.lean else 'OFF'}\n", "info")
+    log.write(f"Resume            : {'ON' if args.resume else 'OFF'}\n", "info")
+    log.write(f"Delta Re-Scrape   : {f'ON (stop after {args.delta_stop} known-only batches)' if args.delta else 'OFF'}{f', known: {args.known}' if args.delta and getattr(args, 'known', None) else ''}\n", "info")
+    log.write(f"Enrichment        : {f'ON ({args.enrich_workers} browser(s), <= {args.enrich_rps:g} req/s, cache TTL {args.enrich_ttl:g}h)' if args.enrich else 'OFF'}\n", "info")
+    log.write(f"Page Snapshots    : {f'{args.snapshot} -> ' + (args.snapshot_dir or 'snapshots/') if args.snapshot else 'OFF'}\n", "info")
+    log.write(f"Extra Exports     : {', '.join(args.export or []) or 'none'}\n", "info")
+    log.write(f"Prometheus File   : {getattr(args, 'prometheus', None) or 'none'}\n", "info")
+    log.write(f"Blacklist Files   : {'; '.join(split_paths(args.blacklist or [])) or 'built-in only'}\n", "info")
+    log.write("=======================================================\n\n", "info")
+
@@ -0,0 +1,124 @@
+import json
+import os
+import time
+from itertools import chain
+from pathlib import Path
+
+from .pipeline import run_pipeline
+from .processing import add_group_record, canonical_group_id
+
+# Store append-only per job: setiap grup ditulis ke journal JSONL begitu ditemukan, plus checkpoint
+# (posisi scroll + jumlah) yang di-fsync berkala. Run yang crash/di-kill bisa dilanjutkan dengan --resume.
+CHECKPOINT_INTERVAL = 5.0  # detik minimum antar fsync checkpoint
+
+
+def store_paths(output_path):
+    """Journal and checkpoint paths that live next to a job's output CSV."""
+    output = Path(output_path)
+    return output.with_name(f"{output.stem}.journal.jsonl"), output.with_name(f"{output.stem}.checkpoint.json")
+
+def partial_output_path(output_path):
+    """Where an interrupted run writes its CSV, so the complete output of an earlier run is not overwritten."""
+    output = Path(output_path)
+    return output.with_name(f"{output.stem}.partial{output.suffix}")
+
+def fsync_write_json(path, data):
+    """Atomically replaces path with data: write to a temp file, fsync, then rename over the old file."""
+    tmp_path = Path(f"{path}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+        f.flush(); os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def iter_journal(journal_path):
+    """Yields (group_id, name, url) records from a journal, skipping a torn last line left by a crash."""
+    try:
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try: record = json.loads(line)
+                except ValueError: continue
+                if not isinstance(record, dict) or not record.get('name') or not record.get('url'): continue
+                # Journal lama belum punya 'id': diturunkan dari URL
+                group_id = record.get('id') or canonical_group_id(record['url'])
+                if group_id: yield group_id, record['name'], record['url']
+    except FileNotFoundError:
+        return
+
+
+class GroupStore(object):
+    """Durable, append-only record of the groups found by one job."""
+    def __init__(self, output_path, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.output_path = str(output_path)
+        self.journal_path, self.checkpoint_path = store_paths(output_path)
+        self.checkpoint_interval = checkpoint_interval
+        self.journal = None
+        self.names = {}  # group_id -> nama yang terakhir ditulis ke journal
+        self.last_checkpoint = None  # checkpoint run sebelumnya (saat resume) atau terakhir yang ditulis
+        self._last_fsync = 0.0
+
+    @property
+    def group_ids(self):
+        return self.names.keys()
+
+    def open(self, resume=False):
+        """Opens the journal. With resume, returns the groups recorded so far ({group_id: (name, url)}); otherwise starts empty."""
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        recovered = {}
+        if resume:
+            for group_id, name, url in iter_journal(self.journal_path): add_group_record(recovered, group_id, name, url)
+            try:
+                with open(self.checkpoint_path, 'r', encoding='utf-8') as f: self.last_checkpoint = json.load(f)
+            except (OSError, ValueError):
+                self.last_checkpoint = None
+        self.names = {group_id: name for group_id, (name, _) in recovered.items()}
+        # Resume: journal ditulis ulang (atomik) tanpa baris rusak/duplikat agar append berikutnya tetap valid
+        tmp_path = Path(f"{self.journal_path}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for group_id, (name, url) in recovered.items(): f.write(self._line(group_id, name, url))
+            f.flush(); os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+        self.journal = open(self.journal_path, 'a', encoding='utf-8')
+        return recovered
+
+    @staticmethod
+    def _line(group_id, name, url):
+        return json.dumps({'id': group_id, 'name': name, 'url': url}, ensure_ascii=False) + '\n'
+
+    def add(self, group_id, name, url):
+        """Appends one group unless it is already recorded under this name. A recorded group given another name
+        (a clean name replacing blacklisted noise) gets a second line; readers keep the preferred one.
+        Returns True when the group_id was new."""
+        previous = self.names.get(group_id)
+        if previous == name: return False
+        self.names[group_id] = name
+        self.journal.write(self._line(group_id, name, url))
+        self.journal.flush()  # sampai di OS: selamat dari proses yang di-kill; fsync menyusul di checkpoint
+        return previous is None
+
+    def add_all(self, group_data):
+        return sum(self.add(group_id, name, url) for group_id, (name, url) in group_data.items())
+
+    def checkpoint(self, scroll_count, status="running", force=False):
+        """Fsyncs the journal and records the scroll position; throttled to checkpoint_interval unless forced."""
+        now = time.monotonic()
+        if not force and now - self._last_fsync < self.checkpoint_interval: return False
+        if self.journal:
+            self.journal.flush(); os.fsync(self.journal.fileno())
+        self.last_checkpoint = {'scroll_count': scroll_count, 'groups': len(self.group_ids), 'status': status, 'updated_at': time.time()}
+        fsync_write_json(self.checkpoint_path, self.last_checkpoint)
+        self._last_fsync = now
+        return True
+
+    def close(self):
+        if self.journal:
+            self.journal.close(); self.journal = None
+
+    def export(self, encoding, profile_name="user", log=None, formats=("csv", "txt"), blacklist=None, metadata=None, output_path=None, extra=()):
+        """Writes the requested outputs (see pipeline.run_pipeline) from the journal, sorted by name, in one pass.
+        output_path overrides the job's output (e.g. partial_output_path for an interrupted run); extra records are
+        exported without being journaled (a delta run's carried-over groups)."""
+        if self.journal: self.journal.flush()
+        try:
+            return run_pipeline(chain(iter_journal(self.journal_path), extra), output_path or self.output_path, encoding, profile_name, blacklist, formats, log, metadata=metadata)
+        except Exception as e:
+            if log: log.error(f"Could not export group data: {e}")